@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import json
 import logging
+import sys
 import time
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Protocol, Set, Tuple
@@ -223,28 +224,13 @@ class AIService:
             return self.normalize_provider_selection(selection_override)
         return self._refresh_selection()
 
-    def _provider_usable_for_fallback(
-        self,
-        provider: str,
-        *,
-        selection_override: Optional[Dict[str, Any]] = None,
-    ) -> bool:
+    def _provider_usable_for_fallback(self, provider: str) -> bool:
         """Return True when provider can be used as fallback candidate."""
         client = self._clients.get(provider)
         if client is None or not client.is_configured():
             return False
 
-        model = self.get_model_for_provider(provider, selection_override=selection_override)
-        if not model:
-            model = self._default_model_for_provider(provider)
-
-        payload = self._metrics.payload_for_provider(provider, model=model, configured=True)
-        health = str(payload.get("health") or "UNKNOWN").upper().strip()
-        probe_status = (
-            str(payload.get("last_probe_status") or payload.get("probe", {}).get("status") or "UNVERIFIED")
-            .upper()
-            .strip()
-        )
+        health, probe_status = self._metrics.health_snapshot(provider, configured=True)
 
         # Do not select providers with known hard-fail states as fallback.
         if probe_status in {"EXHAUSTED", "AUTH_ERROR"}:
@@ -253,13 +239,7 @@ class AIService:
             return False
         return True
 
-    def _effective_fallback_provider(
-        self,
-        primary: str,
-        requested_fallback: str,
-        *,
-        selection_override: Optional[Dict[str, Any]] = None,
-    ) -> str:
+    def _effective_fallback_provider(self, primary: str, requested_fallback: str) -> str:
         """Pick first usable fallback provider, preferring requested fallback."""
         candidates: List[str] = []
         if requested_fallback in _PROVIDER_SET and requested_fallback != primary:
@@ -270,10 +250,7 @@ class AIService:
             candidates.append(candidate)
 
         for candidate in candidates:
-            if self._provider_usable_for_fallback(
-                candidate,
-                selection_override=selection_override,
-            ):
+            if self._provider_usable_for_fallback(candidate):
                 return candidate
         return ""
 
@@ -291,11 +268,7 @@ class AIService:
         if mode == "fixed":
             return [primary]
 
-        effective_fallback = self._effective_fallback_provider(
-            primary,
-            fallback,
-            selection_override=selection,
-        )
+        effective_fallback = self._effective_fallback_provider(primary, fallback)
         if not effective_fallback:
             return [primary]
         return [primary, effective_fallback]
@@ -422,11 +395,7 @@ class AIService:
 
         fallback_provider = ""
         if mode.lower().strip() == "auto":
-            fallback_provider = self._effective_fallback_provider(
-                selected_provider,
-                requested_fallback,
-                selection_override=selection,
-            )
+            fallback_provider = self._effective_fallback_provider(selected_provider, requested_fallback)
         fallback_model = ""
         if fallback_provider:
             requested_fallback_model = str(selection.get("fallback_model") or "").strip()
@@ -434,7 +403,7 @@ class AIService:
                 requested_fallback_model = self._default_model_for_provider(fallback_provider)
             fallback_model = requested_fallback_model
 
-        providers_payload: List[Dict[str, Any]] = []
+        status_items: List[tuple[str, str, bool]] = []
         for provider in _PROVIDER_ORDER:
             client = self._clients.get(provider)
             configured = bool(client and client.is_configured())
@@ -444,11 +413,10 @@ class AIService:
                 model = fallback_model
             else:
                 model = self._default_model_for_provider(provider)
-            provider_payload = self._metrics.payload_for_provider(
-                provider,
-                model=model,
-                configured=configured,
-            )
+            status_items.append((provider, model, configured))
+
+        providers_payload = self._metrics.payloads_for_providers(status_items)
+        for (provider, _model, configured), provider_payload in zip(status_items, providers_payload):
             provider_payload["display_name"] = self._provider_display_name(provider)
             probe_status = str(
                 provider_payload.get("last_probe_status")
@@ -456,7 +424,6 @@ class AIService:
                 or "UNVERIFIED"
             ).upper()
             provider_payload["online"] = bool(configured and probe_status in {"OK", "RATE_LIMITED"})
-            providers_payload.append(provider_payload)
 
         return {
             "selected_provider": selected_provider,
@@ -977,7 +944,9 @@ class AIService:
         for i, sec in enumerate(section_index[seeded_count:], seeded_count + 1):
             self._ensure_not_cancelled()
             section_id = str(sec.get("sectionId") or f"sec-{i:04d}")
-            path = str(sec.get("path") or f"Section {i}")
+            # One shared object per path for the prompt, trace metadata,
+            # section dicts and the validator, which interns paths too.
+            path = sys.intern(str(sec.get("path") or f"Section {i}"))
 
             # Throttle between generated sections to avoid rate-limit bursts
             if sections and _INTER_SECTION_DELAY_S > 0:
@@ -0,0 +1,39 @@
+"""JSON body decoding shared by the HTTP provider clients."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import requests
+
+try:  # Optional faster JSON decoder (``pip install orjson``).
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None  # type: ignore[assignment]
+
+# Sentinel for "body not decoded yet" (``None`` is a valid decoded result).
+UNDECODED: Any = object()
+
+
+def decode_json(response: requests.Response) -> Any:
+    """Decode *response*'s JSON body, preferring orjson on the raw bytes.
+
+    Bodies orjson rejects but ``requests`` accepts (a non-UTF-8 ``charset``,
+    ``NaN``/``Infinity`` literals) fall back to ``response.json()``, which
+    raises if the body is not JSON at all.
+    """
+    content = getattr(response, "content", None)
+    if _orjson is not None and isinstance(content, (bytes, bytearray)) and content:
+        try:
+            return _orjson.loads(content)
+        except _orjson.JSONDecodeError:
+            pass
+    return response.json()
+
+
+def safe_decode_json(response: requests.Response) -> Any:
+    """Like :func:`decode_json`, but return ``None`` for undecodable bodies."""
+    try:
+        return decode_json(response)
+    except Exception:
+        return None
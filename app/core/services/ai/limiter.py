@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import threading
+import time
 from contextlib import asynccontextmanager, contextmanager
-from typing import Dict, Iterator, Optional, Tuple
+from typing import Callable, Dict, Iterator, Optional, Tuple
 
 from app.core.services.ai.rate_limiter import SlidingWindowRateLimiter
 
@@ -22,6 +23,8 @@ class LLMLimiter:
         default_concurrency: int = 2,
         default_rpm: int = 60,
         rate_window_seconds: float = 60.0,
+        time_fn: Callable[[], float] = time.monotonic,
+        sleep_fn: Callable[[float], None] = time.sleep,
     ) -> None:
         self._provider_concurrency = {str(k): max(1, int(v)) for k, v in (provider_concurrency or {}).items()}
         self._provider_rpm = {str(k): max(1, int(v)) for k, v in (provider_rpm or {}).items()}
@@ -29,8 +32,12 @@ class LLMLimiter:
         self._default_concurrency = max(1, int(default_concurrency))
         self._default_rpm = max(1, int(default_rpm))
         self._rate_window_seconds = max(0.1, float(rate_window_seconds))
+        # Clock used by the per-provider RPM windows (injectable for tests).
+        self._time_fn = time_fn
+        self._sleep_fn = sleep_fn
 
         self._lock = threading.RLock()
+        self._waiting_changed = threading.Condition(self._lock)
         self._provider_semaphores: Dict[str, threading.BoundedSemaphore] = {}
         self._tenant_semaphores: Dict[Tuple[str, str], threading.BoundedSemaphore] = {}
         self._rate_limiters: Dict[str, SlidingWindowRateLimiter] = {}
@@ -63,17 +70,21 @@ class LLMLimiter:
                 self._rate_limiters[provider] = SlidingWindowRateLimiter(
                     self._provider_rpm_limit(provider),
                     window_seconds=self._rate_window_seconds,
+                    time_fn=self._time_fn,
+                    sleep_fn=self._sleep_fn,
                 )
             return self._rate_limiters[provider]
 
     def _inc_waiting(self, provider: str) -> None:
         with self._lock:
             self._waiting_by_provider[provider] = int(self._waiting_by_provider.get(provider, 0)) + 1
+            self._waiting_changed.notify_all()
 
     def _dec_waiting(self, provider: str) -> None:
         with self._lock:
             current = int(self._waiting_by_provider.get(provider, 0))
             self._waiting_by_provider[provider] = max(0, current - 1)
+            self._waiting_changed.notify_all()
 
     @contextmanager
     def acquire_sync(self, provider: str, tenant_id: Optional[str] = None) -> Iterator[None]:
@@ -125,6 +136,17 @@ class LLMLimiter:
         with self._lock:
             return int(self._waiting_by_provider.get(provider, 0))
 
+    def wait_queue_depth(self, provider: str, depth: int, timeout: Optional[float] = None) -> bool:
+        """Block until *provider* has at least *depth* waiters; ``False`` on timeout."""
+        deadline = None if timeout is None else time.monotonic() + max(0.0, float(timeout))
+        with self._waiting_changed:
+            while int(self._waiting_by_provider.get(provider, 0)) < depth:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._waiting_changed.wait(remaining)
+            return True
+
     def snapshot(self) -> Dict[str, Dict[str, int]]:
         with self._lock:
             providers = set(self._provider_semaphores) | set(self._rate_limiters) | set(self._waiting_by_provider)
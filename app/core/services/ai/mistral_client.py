@@ -15,9 +15,11 @@ from typing import Any, Optional
 
 import requests  # type: ignore[import-untyped]
 import urllib3
+from requests.adapters import HTTPAdapter
 
 from app.core.config import settings
 from app.core.services.ai.errors import ProviderAuthError, QuotaExceededError
+from app.core.services.ai.http_json import UNDECODED, decode_json, safe_decode_json
 
 # Suppress InsecureRequestWarning since we intentionally use verify=False.
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -44,6 +46,15 @@ class MistralClient:
         if self._session is None:
             self._session = requests.Session()
             self._session.verify = False
+            # Keep-alive pool sized to the provider concurrency cap so parallel
+            # sections reuse TLS connections. Retries are handled in generate().
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=max(1, int(getattr(settings, "MAX_INFLIGHT_MISTRAL", 3))),
+                max_retries=0,
+            )
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
             self._session.headers.update(
                 {
                     "Authorization": f"Bearer {settings.MISTRAL_API_KEY}",
@@ -87,8 +98,9 @@ class MistralClient:
                     )
 
                 if status_code == 429:
-                    retry_after = self._extract_retry_after_seconds(response)
-                    error_message = self._extract_error_message(response)
+                    body = self._safe_json(response)
+                    retry_after = self._extract_retry_after_seconds(response, body)
+                    error_message = self._extract_error_message(response, body)
                     if self._is_exhausted_message(error_message):
                         raise QuotaExceededError(
                             "Quota exceeded. Check Mistral project quota/billing.",
@@ -174,8 +186,9 @@ class MistralClient:
                 }
 
             if status_code == 429:
-                retry_after = self._extract_retry_after_seconds(response)
-                error_message = self._extract_error_message(response)
+                body = self._safe_json(response)
+                retry_after = self._extract_retry_after_seconds(response, body)
+                error_message = self._extract_error_message(response, body)
                 if self._is_exhausted_message(error_message):
                     return {
                         "provider": "mistral",
@@ -217,9 +230,13 @@ class MistralClient:
                 pass
             self._session = None
 
+    @staticmethod
+    def _safe_json(response: requests.Response) -> Any:
+        return safe_decode_json(response)
+
     @staticmethod
     def _extract_text(response: requests.Response) -> str:
-        data = response.json()
+        data = decode_json(response)
         choices = data.get("choices") if isinstance(data, dict) else None
         if not isinstance(choices, list) or not choices:
             return ""
@@ -233,7 +250,7 @@ class MistralClient:
         return content if isinstance(content, str) else ""
 
     @staticmethod
-    def _extract_retry_after_seconds(response: requests.Response) -> Optional[float]:
+    def _extract_retry_after_seconds(response: requests.Response, payload: Any = UNDECODED) -> Optional[float]:
         header = response.headers.get("Retry-After")
         if header:
             try:
@@ -241,10 +258,8 @@ class MistralClient:
             except Exception:
                 pass
 
-        try:
-            payload = response.json()
-        except Exception:
-            payload = None
+        if payload is UNDECODED:
+            payload = MistralClient._safe_json(response)
 
         if isinstance(payload, dict):
             message = payload.get("message") or ""
@@ -261,11 +276,9 @@ class MistralClient:
         return None
 
     @staticmethod
-    def _extract_error_message(response: requests.Response) -> str:
-        try:
-            payload = response.json()
-        except Exception:
-            payload = None
+    def _extract_error_message(response: requests.Response, payload: Any = UNDECODED) -> str:
+        if payload is UNDECODED:
+            payload = MistralClient._safe_json(response)
         if isinstance(payload, dict):
             detail = payload.get("message") or payload.get("detail") or payload.get("error")
             if isinstance(detail, str) and detail.strip():
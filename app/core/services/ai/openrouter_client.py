@@ -7,9 +7,11 @@ import time
 from typing import Any, Dict, Optional
 
 import requests  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter
 
 from app.core.config import settings
 from app.core.services.ai.errors import ProviderAuthError, ProviderTransientError, QuotaExceededError
+from app.core.services.ai.http_json import UNDECODED, safe_decode_json
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +48,16 @@ class OpenRouterClient:
         if self._session is None:
             self._session = requests.Session()
             self._session.headers.update(self._build_headers())
+            # Keep-alive pool sized to the provider concurrency cap so parallel
+            # sections reuse TLS connections. Errors map to typed exceptions
+            # in generate(), so urllib3 must not retry on its own.
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=max(1, int(getattr(settings, "MAX_INFLIGHT_OPENROUTER", 3))),
+                max_retries=0,
+            )
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
             logger.info("OpenRouterClient session created")
         return self._session
 
@@ -94,7 +106,8 @@ class OpenRouterClient:
             ) from exc
 
         status_code = int(response.status_code)
-        error_message = self._extract_error_message(response)
+        payload = self._safe_json(response)
+        error_message = self._extract_error_message(response, payload)
 
         if status_code in {401, 403}:
             raise ProviderAuthError(
@@ -113,7 +126,7 @@ class OpenRouterClient:
             )
 
         if status_code == 429:
-            retry_after = self._extract_retry_after_seconds(response)
+            retry_after = self._extract_retry_after_seconds(response, payload)
             if self._is_exhausted_message(error_message):
                 raise QuotaExceededError(
                     error_message or "OpenRouter quota exhausted.",
@@ -144,7 +157,7 @@ class OpenRouterClient:
             raise RuntimeError(error_message or f"OpenRouter API error {status_code}")
 
         response.raise_for_status()
-        text = self._extract_text(response)
+        text = self._extract_text(response, payload)
         if text.strip():
             return text
         raise RuntimeError("OpenRouter returned empty content")
@@ -188,9 +201,9 @@ class OpenRouterClient:
 
     def _probe_from_response(self, response: requests.Response, started: float) -> Dict[str, Any]:
         status_code = int(response.status_code)
-        detail = self._extract_error_message(response)
-        retry_after = self._extract_retry_after_seconds(response)
         payload = self._safe_json(response)
+        detail = self._extract_error_message(response, payload)
+        retry_after = self._extract_retry_after_seconds(response, payload)
 
         if status_code in {401, 403}:
             return {
@@ -279,14 +292,12 @@ class OpenRouterClient:
 
     @staticmethod
     def _safe_json(response: requests.Response) -> Any:
-        try:
-            return response.json()
-        except Exception:
-            return None
+        return safe_decode_json(response)
 
     @staticmethod
-    def _extract_text(response: requests.Response) -> str:
-        payload = OpenRouterClient._safe_json(response)
+    def _extract_text(response: requests.Response, payload: Any = UNDECODED) -> str:
+        if payload is UNDECODED:
+            payload = OpenRouterClient._safe_json(response)
         if not isinstance(payload, dict):
             return ""
         choices = payload.get("choices")
@@ -312,8 +323,9 @@ class OpenRouterClient:
         return ""
 
     @staticmethod
-    def _extract_error_message(response: requests.Response) -> str:
-        payload = OpenRouterClient._safe_json(response)
+    def _extract_error_message(response: requests.Response, payload: Any = UNDECODED) -> str:
+        if payload is UNDECODED:
+            payload = OpenRouterClient._safe_json(response)
         if isinstance(payload, dict):
             error = payload.get("error")
             if isinstance(error, dict):
@@ -328,7 +340,7 @@ class OpenRouterClient:
         return text[:240]
 
     @staticmethod
-    def _extract_retry_after_seconds(response: requests.Response) -> Optional[float]:
+    def _extract_retry_after_seconds(response: requests.Response, payload: Any = UNDECODED) -> Optional[float]:
         header = response.headers.get("Retry-After")
         if header:
             try:
@@ -338,7 +350,7 @@ class OpenRouterClient:
             except Exception:
                 pass
 
-        message = OpenRouterClient._extract_error_message(response).lower()
+        message = OpenRouterClient._extract_error_message(response, payload).lower()
         if "retry after" in message:
             tail = message.split("retry after", 1)[1].strip().split(" ", 1)[0]
             tail = tail.replace("seconds", "").replace("second", "").replace("s", "").strip()
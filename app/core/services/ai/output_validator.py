@@ -9,8 +9,10 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
 import unicodedata
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 from app.core.services.ai.completeness_validator import strip_placeholder_text
 from app.core.services.content_sanitizer import sanitize_text_block
@@ -28,6 +30,8 @@ class OutputValidator:
 
     # Minimum content length to emit a quality warning (not a hard error)
     MIN_CONTENT_LENGTH = 20
+    # Subset of ``toc_detector.TOC_TITLES``: a path that passed
+    # ``is_toc_path`` can never match here.
     _INDEX_TITLES = frozenset(
         {
             "indice",
@@ -53,6 +57,16 @@ class OutputValidator:
     _ABBREV_PAREN_RE = re.compile(r"^\s*(.+?)\s*\(([\wÁÉÍÓÚÜÑ]{2,})\)\s*$", re.IGNORECASE)
     _SKIP_SECTION_TOKEN = "<<SKIP_SECTION>>"
 
+    # Markdown clean-up, compiled once instead of on every section.
+    _CODE_FENCE_RE = re.compile(r"```[\s\S]*?```")
+    _HEADING_RE = re.compile(r"^\s*#{1,6}\s*", re.MULTILINE)
+    # A bullet marker, a list number, or a bullet followed by a number.
+    _LIST_MARKER_RE = re.compile(r"^\s*(?:[-*+]\s+)?(?:\d+[.)]\s+)?")
+    # Table pipes and runs of blanks, both collapsed to a single space in one
+    # pass; a lone space already is one, so it is left alone.
+    _BLANK_RUN_RE = re.compile(r"[ \t|]{2,}|[\t|]")
+    _WHITESPACE_RE = re.compile(r"\s+")
+
     @staticmethod
     def _normalize_token(value: Any) -> str:
         text = str(value or "").strip().lower()
@@ -61,30 +75,33 @@ class OutputValidator:
         ascii_only = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
         return " ".join(ascii_only.split())
 
+    # ``_FORBIDDEN_PHRASES`` folded the same way lines are, computed once.
+    _FORBIDDEN_TOKENS = tuple(dict.fromkeys(map(_normalize_token, _FORBIDDEN_PHRASES)))
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _path_segments(path: str) -> Tuple[str, ...]:
+        """Normalised ``/`` segments of *path*.
+
+        Memoised: a project's handful of paths is checked on every
+        validation and regeneration, so each is folded only once.
+        """
+        return tuple(OutputValidator._normalize_token(part) for part in path.split("/"))
+
     @classmethod
     def _is_index_path(cls, path: str) -> bool:
-        parts = [cls._normalize_token(part) for part in str(path or "").split("/")]
-        for part in parts:
-            if not part:
-                continue
-            if part in cls._INDEX_TITLES:
-                return True
-        return False
+        return any(part in cls._INDEX_TITLES for part in cls._path_segments(str(path or "")))
 
     @classmethod
     def _is_abbreviations_path(cls, path: str) -> bool:
-        normalized = cls._normalize_token(path)
-        return "abreviaturas" in normalized
+        return any("abreviaturas" in part for part in cls._path_segments(str(path or "")))
 
     @classmethod
     def _line_has_forbidden_phrase(cls, line: str) -> bool:
-        normalized = cls._normalize_token(line).upper()
+        normalized = cls._normalize_token(line)
         if not normalized:
             return False
-        for phrase in cls._FORBIDDEN_PHRASES:
-            if cls._normalize_token(phrase).upper() in normalized:
-                return True
-        return False
+        return any(token in normalized for token in cls._FORBIDDEN_TOKENS)
 
     @staticmethod
     def _collapse_blank_lines(lines: List[str]) -> List[str]:
@@ -138,8 +155,8 @@ class OutputValidator:
             if not sigla or not meaning:
                 continue
 
-            sigla = re.sub(r"\s+", "", sigla)
-            meaning = re.sub(r"\s+", " ", meaning).strip()
+            sigla = cls._WHITESPACE_RE.sub("", sigla)
+            meaning = cls._WHITESPACE_RE.sub(" ", meaning).strip()
             if len(sigla) < 2 or not meaning:
                 continue
             if sigla in seen_siglas:
@@ -153,30 +170,35 @@ class OutputValidator:
     @classmethod
     def sanitize_content(cls, content: Any, *, path: str = "") -> str:
         """Normalize AI content for safe DOCX insertion."""
-        raw = str(content or "")
-        if not raw.strip():
-            return ""
-        if raw.strip() == cls._SKIP_SECTION_TOKEN:
+        if cls._is_index_path(path):
             return ""
+        return cls._sanitize_body(content, path=path)
 
-        if cls._is_index_path(path):
+    @classmethod
+    def _sanitize_body(cls, content: Any, *, path: str) -> str:
+        """``sanitize_content`` minus the index-path check."""
+        raw = str(content or "")
+        stripped = raw.strip()
+        if not stripped or stripped == cls._SKIP_SECTION_TOKEN:
             return ""
 
         # Strip placeholder patterns (safety net)
         text = strip_placeholder_text(raw)
 
         # Remove code fences and common markdown formatting.
-        text = re.sub(r"```[\s\S]*?```", " ", text)
+        text = cls._CODE_FENCE_RE.sub(" ", text)
         text = text.replace("```", " ")
-        text = re.sub(r"^\s*#{1,6}\s*", "", text, flags=re.MULTILINE)
+        text = cls._HEADING_RE.sub("", text)
         text = text.replace("**", "").replace("__", "")
-        text = text.replace("|", " ")
+        # Blanks never span a line break, and a list marker always ends on a
+        # non-blank, so collapsing before the per-line marker strip gives the
+        # same lines as collapsing after it.
+        text = cls._BLANK_RUN_RE.sub(" ", text)
 
+        strip_marker = cls._LIST_MARKER_RE.sub
         cleaned_lines: List[str] = []
         for line in text.splitlines():
-            line = re.sub(r"^\s*[-*+]\s+", "", line)
-            line = re.sub(r"^\s*\d+[.)]\s+", "", line)
-            line = re.sub(r"[ \t]+", " ", line).strip()
+            line = strip_marker("", line, count=1).strip()
             if cls._line_has_forbidden_phrase(line):
                 continue
             cleaned_lines.append(line)
@@ -194,24 +216,23 @@ class OutputValidator:
         # Strip any surviving leader-dot + page-number artefacts.
         return sanitize_text_block(result)
 
-    def validate(self, ai_result: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate and return a normalised ``aiResult``.
+    def validate_many(self, sections: List[Any]) -> List[Dict[str, Any]]:
+        """Validate a batch of raw sections and return the ones that survive.
 
-        Raises :class:`ValidationError` if required structure is missing.
-        Logs warnings for quality issues (short content) but does not
-        reject them.
+        TOC sections and non-dicts are dropped, ids are filled in and made
+        unique, and content is sanitised.  Quality warnings are logged, and
+        an empty result is returned rather than raised; :meth:`validate`
+        adds the ``aiResult`` envelope checks on top.
         """
-        if not isinstance(ai_result, dict):
-            raise ValidationError("aiResult must be a dict")
-
-        sections = ai_result.get("sections")
-        if not isinstance(sections, list) or not sections:
-            raise ValidationError("aiResult.sections must be a non-empty list")
-
         validated: List[Dict[str, Any]] = []
         seen_ids: set = set()
         warnings: List[str] = []
 
+        # Bound once for the whole batch rather than looked up per section.
+        is_toc_path = _shared_is_toc_path
+        sanitize_body = self._sanitize_body
+        intern = sys.intern
+
         for idx, section in enumerate(sections):
             if not isinstance(section, dict):
                 warnings.append(f"Section at index {idx} is not a dict, skipped")
@@ -219,15 +240,20 @@ class OutputValidator:
 
             section_id = section.get("sectionId") or section.get("section_id", "")
             path = section.get("path", "")
+            if type(path) is str:
+                # The same handful of paths recurs across every validated
+                # result and regeneration; keep one shared copy of each.
+                path = intern(path)
             content = section.get("content", "")
 
             # --- TOC defence: drop the section entirely ----------------
-            if _shared_is_toc_path(path):
+            if is_toc_path(path):
                 warnings.append(f"Dropped non-generative TOC section '{section_id}' (path='{path}')")
                 continue
             # -----------------------------------------------------------
 
-            content = self.sanitize_content(content, path=path)
+            # The TOC check above already rules out every index path.
+            content = sanitize_body(content, path=path)
 
             # sectionId is required
             if not section_id:
@@ -262,6 +288,23 @@ class OutputValidator:
             for w in warnings:
                 logger.warning("OutputValidator: %s", w)
 
+        return validated
+
+    def validate(self, ai_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate and return a normalised ``aiResult``.
+
+        Raises :class:`ValidationError` if required structure is missing.
+        Logs warnings for quality issues (short content) but does not
+        reject them.
+        """
+        if not isinstance(ai_result, dict):
+            raise ValidationError("aiResult must be a dict")
+
+        sections = ai_result.get("sections")
+        if not isinstance(sections, list) or not sections:
+            raise ValidationError("aiResult.sections must be a non-empty list")
+
+        validated = self.validate_many(sections)
         if not validated:
             raise ValidationError("No valid sections after validation")
 
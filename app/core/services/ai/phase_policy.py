@@ -3,19 +3,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Tuple
 
 from app.core.config import settings
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhasePolicy:
     critical: bool
-    fallback_chain: List[str]
+    fallback_chain: Tuple[str, ...]
     max_input_tokens: int
     max_output_tokens: int
     allow_degraded: bool
 
+    def __post_init__(self) -> None:
+        # Accept any iterable but store a tuple so policies stay hashable.
+        if type(self.fallback_chain) is not tuple:
+            object.__setattr__(self, "fallback_chain", tuple(self.fallback_chain))
+
 
 def _parse_chain(raw: str, defaults: Iterable[str]) -> List[str]:
     parts = [item.strip() for item in str(raw or "").split(",") if item.strip()]
@@ -47,14 +52,14 @@ def build_phase_policies() -> Dict[str, PhasePolicy]:
     return {
         "generate_section": PhasePolicy(
             critical=True,
-            fallback_chain=generate_chain,
+            fallback_chain=tuple(generate_chain),
             max_input_tokens=max(500, int(getattr(settings, "LLM_MAX_INPUT_TOKENS_GENERATE", 6000))),
             max_output_tokens=max(100, int(getattr(settings, "LLM_MAX_OUTPUT_TOKENS_GENERATE", 1400))),
             allow_degraded=False,
         ),
         "cleanup_correction": PhasePolicy(
             critical=False,
-            fallback_chain=cleanup_chain,
+            fallback_chain=tuple(cleanup_chain),
             max_input_tokens=max(500, int(getattr(settings, "LLM_MAX_INPUT_TOKENS_CLEANUP", 3500))),
             max_output_tokens=max(100, int(getattr(settings, "LLM_MAX_OUTPUT_TOKENS_CLEANUP", 900))),
             allow_degraded=True,
@@ -11,7 +11,8 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +64,37 @@ SYSTEM_PROMPT = (
     "Ahora redacta la seccion {section_path} cumpliendo TODO.\n"
 )
 
+# Every {{variable}} occurrence in SYSTEM_PROMPT, in order, and the distinct
+# names among them; derived so they cannot drift from the prompt text.
+_SYSTEM_PLACEHOLDERS = tuple(_PLACEHOLDER_RE.findall(SYSTEM_PROMPT))
+_SYSTEM_VARS = tuple(dict.fromkeys(_SYSTEM_PLACEHOLDERS))
+# Key for "no system variable set": rendering would leave SYSTEM_PROMPT as-is.
+_NO_SYSTEM_VALUES: Tuple[Optional[str], ...] = (None,) * len(_SYSTEM_VARS)
+
+
+def _system_prompt_key(values: Dict[str, Any]) -> Tuple[Optional[str], ...]:
+    """Rendered text of each system variable, ``None`` where it is missing."""
+    key: List[Optional[str]] = []
+    for name in _SYSTEM_VARS:
+        value = values.get(name)
+        key.append(None if value in (None, "") else str(value))
+    return tuple(key)
+
+
+@lru_cache(maxsize=256)
+def _render_system_prompt(key: Tuple[Optional[str], ...]) -> str:
+    """SYSTEM_PROMPT with its variables filled in, once per distinct *key*.
+
+    Every section of a project renders the same values into it.
+    """
+    rendered = dict(zip(_SYSTEM_VARS, key))
+
+    def _replace(match: re.Match) -> str:
+        value = rendered.get(match.group(1))
+        return match.group(0) if value is None else value
+
+    return _PLACEHOLDER_RE.sub(_replace, SYSTEM_PROMPT)
+
 
 class PromptRenderer:
     """Renders prompt templates by replacing {{variable}} placeholders."""
@@ -89,15 +121,19 @@ class PromptRenderer:
             return ""
 
         missing: List[str] = []
+        result = template
+        # Plain-text templates (most base prompts) skip the regex scan and
+        # the substitution closure.
+        if "{{" in template:
 
-        def _replace(match: re.Match) -> str:
-            key = match.group(1)
-            if key in values and values[key] not in (None, ""):
-                return str(values[key])
-            missing.append(key)
-            return match.group(0)
+            def _replace(match: re.Match) -> str:
+                key = match.group(1)
+                if key in values and values[key] not in (None, ""):
+                    return str(values[key])
+                missing.append(key)
+                return match.group(0)
 
-        result = _PLACEHOLDER_RE.sub(_replace, template)
+            result = _PLACEHOLDER_RE.sub(_replace, template)
 
         if missing:
             logger.warning(
@@ -135,18 +171,27 @@ class PromptRenderer:
         values: Dict[str, Any] | None = None,
     ) -> str:
         """Build a prompt for generating a single section."""
-        rendered_system = self.render(SYSTEM_PROMPT, values or {})
+        key = _system_prompt_key(values) if values else _NO_SYSTEM_VALUES
+        rendered_system = SYSTEM_PROMPT if key == _NO_SYSTEM_VALUES else _render_system_prompt(key)
+        if None in key:
+            absent = {name for name, value in zip(_SYSTEM_VARS, key) if value is None}
+            missing = [name for name in _SYSTEM_PLACEHOLDERS if name in absent]
+            logger.warning(
+                "PromptRenderer: missing variables %s - kept as placeholders",
+                missing,
+            )
         rendered_system = rendered_system.replace("{section_path}", section_path)
         rendered_system = rendered_system.replace("{section_id}", section_id)
 
         parts = [rendered_system]
 
-        if base_prompt.strip():
+        base = base_prompt.strip()
+        if base:
             parts.extend(
                 [
                     "",
                     "CONTEXTO ADICIONAL DEL PROYECTO:",
-                    base_prompt.strip(),
+                    base,
                 ]
             )
 
@@ -14,13 +14,18 @@ import datetime as dt
 import math
 import threading
 from dataclasses import dataclass, field
-from typing import Any, Deque, Dict, Optional
+from typing import Any, Deque, Dict, Iterable, List, Optional
 
 from app.core.config import settings
 
 _WINDOW_15M_SECONDS = 15 * 60
 _RATE_WINDOW_SECONDS = 60
 _TIMEOUT_DEGRADED_THRESHOLD = 3
+_DISPLAY_NAMES = {
+    "gemini": "Gemini",
+    "mistral": "Mistral",
+    "openrouter": "OpenRouter",
+}
 
 
 def _utc_now() -> dt.datetime:
@@ -65,7 +70,7 @@ def _contains_rate_limited(text: str) -> bool:
     return any(marker in lowered for marker in markers)
 
 
-@dataclass
+@dataclass(slots=True)
 class _ProviderRuntime:
     requests_1m: Deque[dt.datetime] = field(default_factory=collections.deque)
     errors_15m: Deque[tuple[dt.datetime, str, str]] = field(default_factory=collections.deque)
@@ -149,7 +154,12 @@ class ProviderMetricsService:
         return "error"
 
     def _state(self, provider: str) -> _ProviderRuntime:
-        return self._runtime.setdefault(provider, _ProviderRuntime())
+        # Not setdefault(): that would build a throwaway runtime (two deques
+        # and a month key) on every lookup of a provider that already exists.
+        state = self._runtime.get(provider)
+        if state is None:
+            state = self._runtime[provider] = _ProviderRuntime()
+        return state
 
     def record_success(
         self,
@@ -314,72 +324,106 @@ class ProviderMetricsService:
             return "DEGRADED"
         return "OK"
 
-    def payload_for_provider(self, provider: str, *, model: str, configured: bool) -> Dict[str, Any]:
+    def health_snapshot(self, provider: str, *, configured: bool) -> tuple[str, str]:
+        """Return ``(health, last_probe_status)`` without building the UI payload."""
         now = _utc_now()
         with self._lock:
             state = self._state(provider)
             state.trim(now)
+            return self._derive_health(state, now=now, configured=configured), state.last_probe_status
+
+    def payload_for_provider(self, provider: str, *, model: str, configured: bool) -> Dict[str, Any]:
+        return self.payloads_for_providers([(provider, model, configured)])[0]
 
-            health = self._derive_health(state, now=now, configured=configured)
-            rate_limit_limit = self._rate_limit_per_minute()
-            used_1m = len(state.requests_1m)
-            remaining_1m = max(0, rate_limit_limit - used_1m)
-
-            reset_seconds = 0
-            if state.rate_limited_until and state.rate_limited_until > now:
-                reset_seconds = int(math.ceil((state.rate_limited_until - now).total_seconds()))
-            elif used_1m >= rate_limit_limit and state.requests_1m:
-                reset_seconds = max(
-                    0,
-                    int(math.ceil(_RATE_WINDOW_SECONDS - (now - state.requests_1m[0]).total_seconds())),
+    def payloads_for_providers(self, items: Iterable[tuple[str, str, bool]]) -> List[Dict[str, Any]]:
+        """Build UI payloads for ``(provider, model, configured)`` items in one pass.
+
+        The clock, the configured limits and the lock are taken once for the
+        whole batch, so every provider is reported against the same instant.
+        """
+        now = _utc_now()
+        rate_limit_limit = self._rate_limit_per_minute()
+        quota_limit_tokens = self._quota_limit_tokens_month()
+        with self._lock:
+            return [
+                self._build_payload(
+                    provider,
+                    model=model,
+                    configured=configured,
+                    now=now,
+                    rate_limit_limit=rate_limit_limit,
+                    quota_limit_tokens=quota_limit_tokens,
                 )
+                for provider, model, configured in items
+            ]
 
-            quota_limit_tokens = self._quota_limit_tokens_month()
-            quota_remaining = (
-                max(0, quota_limit_tokens - state.quota_tokens_used) if quota_limit_tokens is not None else None
+    def _build_payload(
+        self,
+        provider: str,
+        *,
+        model: str,
+        configured: bool,
+        now: dt.datetime,
+        rate_limit_limit: int,
+        quota_limit_tokens: Optional[int],
+    ) -> Dict[str, Any]:
+        state = self._state(provider)
+        state.trim(now)
+
+        health = self._derive_health(state, now=now, configured=configured)
+        used_1m = len(state.requests_1m)
+        remaining_1m = max(0, rate_limit_limit - used_1m)
+
+        reset_seconds = 0
+        if state.rate_limited_until and state.rate_limited_until > now:
+            reset_seconds = int(math.ceil((state.rate_limited_until - now).total_seconds()))
+        elif used_1m >= rate_limit_limit and state.requests_1m:
+            reset_seconds = max(
+                0,
+                int(math.ceil(_RATE_WINDOW_SECONDS - (now - state.requests_1m[0]).total_seconds())),
             )
 
-            errors_last_15m = len(state.errors_15m)
-            avg_latency_ms = int(round(state.latency_ema_ms or 0))
-
-            return {
-                "id": provider,
-                "display_name": {
-                    "gemini": "Gemini",
-                    "mistral": "Mistral",
-                    "openrouter": "OpenRouter",
-                }.get(provider, provider.capitalize()),
-                "model": model,
-                "health": health,
-                "configured": configured,
-                "probe": {
-                    "status": state.last_probe_status,
-                    "checked_at": state.last_probe_checked_at,
-                    "detail": state.last_probe_detail or None,
-                    "retry_after_s": state.last_probe_retry_after_s,
-                    "meta": state.last_probe_meta,
-                },
-                "last_probe_status": state.last_probe_status,
-                "last_probe_checked_at": state.last_probe_checked_at,
-                "last_probe_detail": state.last_probe_detail or None,
-                "last_probe_retry_after_s": state.last_probe_retry_after_s,
-                "last_probe_meta": state.last_probe_meta,
-                "rate_limit": {
-                    "remaining": remaining_1m,
-                    "limit": rate_limit_limit,
-                    "reset_seconds": reset_seconds,
-                },
-                "quota": {
-                    "remaining": quota_remaining,
-                    "limit": quota_limit_tokens,
-                    "remaining_tokens": quota_remaining,
-                    "limit_tokens": quota_limit_tokens,
-                    "period": "month",
-                    "note": "local_estimate",
-                },
-                "stats": {
-                    "avg_latency_ms": avg_latency_ms,
-                    "errors_last_15m": errors_last_15m,
-                    "last_error": state.last_error or None,
-                },
-            }
+        quota_remaining = (
+            max(0, quota_limit_tokens - state.quota_tokens_used) if quota_limit_tokens is not None else None
+        )
+
+        errors_last_15m = len(state.errors_15m)
+        avg_latency_ms = int(round(state.latency_ema_ms or 0))
+
+        return {
+            "id": provider,
+            "display_name": _DISPLAY_NAMES.get(provider) or provider.capitalize(),
+            "model": model,
+            "health": health,
+            "configured": configured,
+            "probe": {
+                "status": state.last_probe_status,
+                "checked_at": state.last_probe_checked_at,
+                "detail": state.last_probe_detail or None,
+                "retry_after_s": state.last_probe_retry_after_s,
+                "meta": state.last_probe_meta,
+            },
+            "last_probe_status": state.last_probe_status,
+            "last_probe_checked_at": state.last_probe_checked_at,
+            "last_probe_detail": state.last_probe_detail or None,
+            "last_probe_retry_after_s": state.last_probe_retry_after_s,
+            "last_probe_meta": state.last_probe_meta,
+            "rate_limit": {
+                "remaining": remaining_1m,
+                "limit": rate_limit_limit,
+                "reset_seconds": reset_seconds,
+            },
+            "quota": {
+                "remaining": quota_remaining,
+                "limit": quota_limit_tokens,
+                "remaining_tokens": quota_remaining,
+                "limit_tokens": quota_limit_tokens,
+                "period": "month",
+                "note": "local_estimate",
+            },
+            "stats": {
+                "avg_latency_ms": avg_latency_ms,
+                "errors_last_15m": errors_last_15m,
+                "last_error": state.last_error or None,
+            },
+        }
@@ -27,23 +27,40 @@ import re
 #   "TÍTULO … pag. 12"
 #   "TÍTULO          24"  (many spaces then a number)
 #   "TÍTULO ... pag X"    (literal "pag X")
+#
+# Any whitespace (NBSP, ideographic space, ...) may follow a dot run or
+# "pag", where ``\s*`` cannot overlap its neighbours.  A blank run is only
+# extended with ``\s*`` after a non-space/tab whitespace character:
+# ``[ \t]{4,}\s*`` is what let the pattern backtrack catastrophically on
+# long space runs.
 _LEADER_PAGE_RE = re.compile(
     r"(?:"
-    r"[.\u2026]{3,}"        # 3+ dots or ellipsis chars
-    r"|[ \t]{4,}"           # OR 4+ spaces/tabs (right-aligned page number)
-    r")"
+    "[.\u2026]{3,}"  # 3+ dots or ellipsis chars
     r"\s*"
-    r"(?:pag\.?\s*)?"       # optional "pag" / "pag."
-    r"(?:\d+|X)"            # page number or literal "X"
-    r"\s*$",
-    re.IGNORECASE,
+    r"|[ \t]{4,}(?:[^\S \t]\s*)?"  # OR 4+ spaces/tabs (right-aligned page number)
+    r")"
+    r"(?:[Pp][Aa][Gg]\.?\s*)?"  # optional "pag" / "pag." (any case)
+    r"(?:\d+|[Xx])"  # page number or literal "X"
+    r"\s*$"
 )
 
 # Simpler pattern: just "pag X" or "pag 12" at the end of a line
-_PAG_SUFFIX_RE = re.compile(
-    r"\s+pag\.?\s+(?:\d+|X)\s*$",
-    re.IGNORECASE,
-)
+_PAG_SUFFIX_RE = re.compile(r"\s+[Pp][Aa][Gg]\.?\s+(?:\d+|[Xx])\s*$")
+
+# The patterns spell out ASCII case variants instead of using IGNORECASE;
+# keyword prechecks fold case with this table, which is a plain C loop.
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def _has_page_tail(tail: str) -> bool:
+    """Whether the right-stripped *tail* ends like a page reference.
+
+    Every leader/page pattern ends in ``\\d`` or "X"; ``str.isdecimal`` is
+    exactly the set ``\\d`` matches, so lines failing this check can skip the
+    regex engine without changing what is detected.
+    """
+    last = tail[-1:]
+    return last.isdecimal() or last == "x" or last == "X"
 
 
 def has_leader_page_pattern(text: str) -> bool:
@@ -51,7 +68,11 @@ def has_leader_page_pattern(text: str) -> bool:
     if not text:
         return False
     for line in text.splitlines():
-        if _LEADER_PAGE_RE.search(line) or _PAG_SUFFIX_RE.search(line):
+        if not _has_page_tail(line.rstrip()):
+            continue
+        if _LEADER_PAGE_RE.search(line):
+            return True
+        if "pag" in line.translate(_ASCII_LOWER) and _PAG_SUFFIX_RE.search(line):
             return True
     return False
 
@@ -62,41 +83,43 @@ def strip_leader_page(line: str) -> str:
     Returns the cleaned line.  If the entire line is just a page-number
     pattern (nothing left after stripping), returns an empty string.
     """
-    cleaned = _LEADER_PAGE_RE.sub("", line)
-    cleaned = _PAG_SUFFIX_RE.sub("", cleaned)
+    cleaned = line.rstrip()
+    if not _has_page_tail(cleaned):
+        return cleaned
+    cleaned = _LEADER_PAGE_RE.sub("", cleaned)
+    if "pag" in cleaned.translate(_ASCII_LOWER):
+        cleaned = _PAG_SUFFIX_RE.sub("", cleaned)
     return cleaned.rstrip()
 
 
-def sanitize_text_block(text: str) -> str:
-    """Clean an entire multi-line block, stripping leader+page patterns.
+def _sanitize_scan(text: str) -> str:
+    """Single forward pass over ``text.splitlines()``: clean each line with
+    :func:`strip_leader_page`, collapse blank runs and trim blank edges.
 
-    Empty lines resulting from stripping are collapsed.
+    Only the kept output lines are accumulated.
     """
-    if not text:
-        return ""
+    strip_line = strip_leader_page
 
-    cleaned_lines: list[str] = []
+    out: list[str] = []
+    pending_blank = False  # a blank line seen after some content
     for line in text.splitlines():
-        cleaned = strip_leader_page(line)
-        cleaned_lines.append(cleaned)
-
-    # Collapse consecutive blank lines.
-    result_lines: list[str] = []
-    prev_blank = False
-    for line in cleaned_lines:
-        is_blank = not line.strip()
-        if is_blank:
-            if prev_blank:
-                continue
-            prev_blank = True
+        cleaned = strip_line(line)
+        if not cleaned.strip():
+            pending_blank = bool(out)
         else:
-            prev_blank = False
-        result_lines.append(line)
+            if pending_blank:
+                out.append("")
+                pending_blank = False
+            out.append(cleaned)
 
-    # Strip leading/trailing blank lines.
-    while result_lines and not result_lines[0].strip():
-        result_lines.pop(0)
-    while result_lines and not result_lines[-1].strip():
-        result_lines.pop()
+    return "\n".join(out)
 
-    return "\n".join(result_lines)
+
+def sanitize_text_block(text: str) -> str:
+    """Clean an entire multi-line block, stripping leader+page patterns.
+
+    Empty lines resulting from stripping are collapsed.
+    """
+    if not text:
+        return ""
+    return _sanitize_scan(text)
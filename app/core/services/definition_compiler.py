@@ -38,7 +38,7 @@ class IRNodeType(Enum):
     PAGE_BREAK = "page_break"
 
 
-@dataclass
+@dataclass(slots=True)
 class IRNode:
     """A node in the document intermediate representation."""
 
@@ -331,13 +331,19 @@ _DIRECTIVE_TYPE_TO_IR: Dict[str, IRNodeType] = {
 }
 
 
+# Node types that form the leading TOC / list block of the document.
+_TOC_IR_TYPES = frozenset(_DIRECTIVE_TYPE_TO_IR.values())
+
+
 def _emit_toc_directives(directives: List[Dict[str, Any]], nodes: List[IRNode]) -> None:
     """Convert normalised TOC directive blocks into IR nodes."""
-    for directive in directives:
-        dtype = directive.get("type", "toc")
-        title = directive.get("title", "")
-        node_type = _DIRECTIVE_TYPE_TO_IR.get(dtype, IRNodeType.TOC_PLACEHOLDER)
-        nodes.append(IRNode(node_type=node_type, text=title))
+    nodes.extend(
+        IRNode(
+            node_type=_DIRECTIVE_TYPE_TO_IR.get(directive.get("type", "toc"), IRNodeType.TOC_PLACEHOLDER),
+            text=directive.get("title", ""),
+        )
+        for directive in directives
+    )
 
 
 def compile_definition_to_ir(definition: Dict[str, Any]) -> DocumentIR:
@@ -436,12 +442,6 @@ def compile_definition_to_ir(definition: Dict[str, Any]) -> DocumentIR:
     # If tables/figures were discovered in the body but no LIST_TABLES /
     # LIST_FIGURES directive existed, inject them after the TOC nodes.
     existing_types = {n.node_type for n in ir.nodes}
-    _TOC_IR_TYPES = (
-        IRNodeType.TOC_PLACEHOLDER,
-        IRNodeType.LIST_TABLES,
-        IRNodeType.LIST_FIGURES,
-        IRNodeType.LIST_ABBREVIATIONS,
-    )
     insert_pos = 0
     for i, n in enumerate(ir.nodes):
         if n.node_type in _TOC_IR_TYPES:
@@ -449,25 +449,27 @@ def compile_definition_to_ir(definition: Dict[str, Any]) -> DocumentIR:
         else:
             break
 
+    injected: List[IRNode] = []
     if ir.tables and IRNodeType.LIST_TABLES not in existing_types:
-        ir.nodes.insert(
-            insert_pos,
+        injected.append(
             IRNode(
                 node_type=IRNodeType.LIST_TABLES,
                 text="LISTA DE TABLAS (simulacion)",
-            ),
+            )
         )
-        insert_pos += 1
 
     if ir.figures and IRNodeType.LIST_FIGURES not in existing_types:
-        ir.nodes.insert(
-            insert_pos,
+        injected.append(
             IRNode(
                 node_type=IRNodeType.LIST_FIGURES,
                 text="LISTA DE FIGURAS (simulacion)",
-            ),
+            )
         )
 
+    # One slice assignment shifts the tail once instead of once per insert.
+    if injected:
+        ir.nodes[insert_pos:insert_pos] = injected
+
     return ir
 
 
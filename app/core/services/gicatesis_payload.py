@@ -17,12 +17,14 @@ format where:
   receives generated content.
 
 The original format dict is **not** mutated — a deep copy is returned.
+Read-only mappings (e.g. ``MappingProxyType``) and tuples are accepted as
+input and come back as plain ``dict``/``list`` containers.
 """
 
 from __future__ import annotations
 
-import copy
 import unicodedata
+from collections.abc import Mapping
 from typing import Any, Dict, List, Optional
 
 from app.core.services.toc_detector import is_toc_path
@@ -57,6 +59,19 @@ def _norm(value: str) -> str:
     return " ".join(ascii_only.split())
 
 
+def _copy_tree(obj: Any) -> Any:
+    """Deep-copy a JSON-like tree into plain mutable ``dict``/``list`` nodes.
+
+    Cheaper than ``copy.deepcopy`` (no memo / reflection) and also thaws
+    read-only inputs such as ``MappingProxyType`` or tuples.
+    """
+    if isinstance(obj, Mapping):
+        return {key: _copy_tree(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_copy_tree(value) for value in obj]
+    return obj
+
+
 def _build_content_map(
     sections: List[Dict[str, str]],
 ) -> Dict[str, str]:
@@ -244,7 +259,8 @@ def build_gicatesis_payload(
     Parameters
     ----------
     format_definition:
-        The raw ``definition`` object from the format detail.
+        The raw ``definition`` object from the format detail.  Any
+        mapping works, including read-only ones.
     ai_sections:
         ``aiResult["sections"]`` — list of ``{sectionId, path, content}``.
 
@@ -254,7 +270,7 @@ def build_gicatesis_payload(
         A copy of *format_definition* suitable for GicaTesis render,
         with ``desarrollo`` fields populated and guidance in ``_meta``.
     """
-    payload = copy.deepcopy(format_definition)
+    payload = _copy_tree(format_definition)
     content_map = _build_content_map(ai_sections)
 
     # --- Preliminares (skip indices, inject into everything else) ---------
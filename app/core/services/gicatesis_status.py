@@ -16,18 +16,26 @@ class GicaTesisStatus:
     """Mutable, in-memory connectivity state for GicaTesis upstream."""
 
     def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore the initial (never contacted) state."""
         self.online: bool = True
         self.last_success_at: Optional[str] = None
         self.last_error: Optional[str] = None
         self.data_source: str = "none"  # "live" | "cache" | "demo" | "none"
+        # True once any record_* call has touched the state since reset().
+        self._dirty: bool = False
 
     def record_success(self, *, source: str = "live") -> None:
+        self._dirty = True
         self.online = True
         self.last_success_at = dt.datetime.now(dt.timezone.utc).isoformat()
         self.last_error = None
         self.data_source = source
 
     def record_failure(self, error: str, *, source: str = "cache") -> None:
+        self._dirty = True
         self.online = False
         self.last_error = error
         self.data_source = source
@@ -25,15 +25,30 @@ consumer only sees the canonical directive format.
 
 from __future__ import annotations
 
-import copy
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from app.core.services.toc_detector import normalize_title
 
 logger = logging.getLogger(__name__)
 
-# Canonical directive type mapping based on normalised title fragments.
+# Exact normalised titles → directive type.  Covers every canonical index
+# heading so the common case is a single dict probe.
+_EXACT_TITLE_TO_TYPE: Dict[str, str] = {
+    "indice": "toc",
+    "indice de contenido": "toc",
+    "indice de contenidos": "toc",
+    "tabla de contenido": "toc",
+    "tabla de contenidos": "toc",
+    "table of contents": "toc",
+    "toc": "toc",
+    "indice de tablas": "toc_tables",
+    "indice de figuras": "toc_figures",
+    "indice de abreviaturas": "toc_abbreviations",
+}
+
+# Fallback for non-canonical titles, based on normalised title fragments.
 _TITLE_TO_TYPE: List[tuple[str, str]] = [
     ("tabla", "toc_tables"),
     ("figuras", "toc_figures"),
@@ -41,9 +56,17 @@ _TITLE_TO_TYPE: List[tuple[str, str]] = [
 ]
 
 
+@lru_cache(maxsize=256)
 def _infer_directive_type(title: str) -> str:
-    """Map a TOC/index title to a canonical directive ``type``."""
+    """Map a TOC/index title to a canonical directive ``type``.
+
+    Memoised: format definitions reuse a small set of index titles, so
+    repeated normalisations skip the Unicode folding in ``normalize_title``.
+    """
     norm = normalize_title(title)
+    dtype = _EXACT_TITLE_TO_TYPE.get(norm)
+    if dtype is not None:
+        return dtype
     for fragment, dtype in _TITLE_TO_TYPE:
         if fragment in norm:
             return dtype
@@ -111,14 +134,9 @@ def _normalize_array_indices(indices: List[Any]) -> List[Dict[str, Any]]:
     The ``items`` arrays with ``pag`` fields are **discarded** — page numbers
     are auto-calculated by Word.
     """
-    directives: List[Dict[str, Any]] = []
-    for entry in indices:
-        if not isinstance(entry, dict):
-            continue
-        title = entry.get("titulo") or entry.get("title") or ""
-        if isinstance(title, str) and title.strip():
-            directives.append(_make_directive(title.strip()))
-    return directives
+    titles = (entry.get("titulo") or entry.get("title") or "" for entry in indices if isinstance(entry, dict))
+    stripped = (title.strip() for title in titles if isinstance(title, str))
+    return [_make_directive(title) for title in stripped if title]
 
 
 # ------------------------------------------------------------------
@@ -174,7 +192,10 @@ def normalize_definition(definition: Dict[str, Any]) -> Dict[str, Any]:
     """Return a **copy** of *definition* with ``preliminares.indices``
     normalised to TOC directive blocks.
 
-    The original dict is never mutated.
+    The original dict is never mutated.  The copy is shallow: only the
+    top-level dict and ``preliminares`` are new, every other branch is
+    shared with *definition*, so callers must not mutate the result in
+    place below that level.
     """
     if not isinstance(definition, dict):
         return definition
@@ -195,6 +216,10 @@ def normalize_definition(definition: Dict[str, Any]) -> Dict[str, Any]:
     if normalised is raw_indices:
         return definition
 
-    result = copy.deepcopy(definition)
-    result["preliminares"]["indices"] = normalised
+    # Copy only the spine down to the rewritten key; ``cuerpo``, ``finales``
+    # and the other preliminares entries are shared with the input.
+    new_preliminares = dict(preliminares)
+    new_preliminares["indices"] = normalised
+    result = dict(definition)
+    result["preliminares"] = new_preliminares
     return result
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import collections
+import copy
 import datetime as dt
-from typing import Any, Callable, Dict, List, Optional
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
 
-from app.core.storage.json_store import JsonStore
+from app.core.storage.json_store import JsonLinesStore, JsonStore
 from app.core.utils.id import new_id
 
 _TRACE_MAX_EVENTS = 200
@@ -14,6 +18,59 @@ class ProjectService:
 
     def __init__(self, path: str = "data/projects.json"):
         self.store = JsonStore(path)
+        # Per-project append-only event logs, e.g. data/projects/<id>.events.jsonl.
+        # They are folded back into the main store on the next full write.
+        self._events_dir = self.store.path.with_suffix("")
+        # Serialises read-modify-write cycles; held for the whole of a batch.
+        self._lock = threading.RLock()
+        self._batch_items: Optional[List[Dict[str, Any]]] = None
+        self._batch_dirty = False
+        # Projects whose event log was folded into the pending batch items.
+        # Their logs are kept until the batch is flushed to the store.
+        self._batch_folded: set[str] = set()
+        # Newest encoded lines of each non-empty event log, so appends do not
+        # re-read the file.  Dropped whenever the log itself is deleted.
+        self._log_tails: Dict[str, Deque[bytes]] = {}
+
+    def _read_items(self) -> List[Dict[str, Any]]:
+        if self._batch_items is not None:
+            return self._batch_items
+        return self.store.read_list()
+
+    def _write_items(self, items: List[Dict[str, Any]]) -> None:
+        if self._batch_items is not None:
+            self._batch_items = items
+            self._batch_dirty = True
+            return
+        self.store.write_list(items)
+
+    @contextmanager
+    def batch(self) -> Iterator["ProjectService"]:
+        """Coalesce every mutation made inside the block into one store write.
+
+        Reads inside the block see the pending state.  Other threads using
+        this service wait until the batch is flushed.  Nested batches join
+        the outermost one.
+        """
+        with self._lock:
+            if self._batch_items is not None:
+                yield self
+                return
+            self._batch_items = self.store.read_list()
+            self._batch_dirty = False
+            self._batch_folded = set()
+            try:
+                yield self
+            finally:
+                items, dirty, folded = self._batch_items, self._batch_dirty, self._batch_folded
+                self._batch_items = None
+                self._batch_dirty = False
+                self._batch_folded = set()
+                if dirty:
+                    self.store.write_list(items)
+                    # Only now do the folded events live in the store.
+                    for project_id in folded:
+                        self._drop_events_log(project_id)
 
     @staticmethod
     def _default_progress(*, provider: str = "") -> Dict[str, Any]:
@@ -112,13 +169,50 @@ class ProjectService:
         )
         return normalized
 
+    def _events_log(self, project_id: str) -> JsonLinesStore:
+        return JsonLinesStore(self._events_dir / f"{project_id}.events.jsonl")
+
+    def _load_project(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalise *raw* and merge in events still pending in its log."""
+        project = self._normalize_project(raw)
+        project_id = str(project.get("id") or "")
+        if project_id in self._batch_folded:
+            # Already merged into the pending batch items.
+            return project
+        log = self._events_log(project_id)
+        tail = self._log_tails.get(project_id)
+        if tail is None:
+            lines = log.tail_lines(_TRACE_MAX_EVENTS)
+            if not lines:
+                return project
+            tail = self._log_tails[project_id] = collections.deque(lines, maxlen=_TRACE_MAX_EVENTS)
+        if tail:
+            events = project["events"]
+            events.extend(log.decode(tail))
+            overflow = len(events) - _TRACE_MAX_EVENTS
+            if overflow > 0:
+                del events[:overflow]
+        return project
+
+    def _drop_events_log(self, project_id: str) -> None:
+        self._events_log(project_id).delete()
+        self._log_tails.pop(project_id, None)
+
+    def _append_to_log(self, project_id: str, events: List[Dict[str, Any]]) -> None:
+        lines = self._events_log(project_id).extend(events)
+        tail = self._log_tails.get(project_id)
+        if tail is not None:
+            tail.extend(lines)
+
     def list_projects(self) -> List[Dict[str, Any]]:
-        return [self._normalize_project(item) for item in self.store.read_list()]
+        with self._lock:
+            return [self._load_project(item) for item in self._read_items()]
 
     def get_project(self, project_id: str) -> Optional[Dict[str, Any]]:
-        for p in self.store.read_list():
-            if p.get("id") == project_id:
-                return self._normalize_project(p)
+        with self._lock:
+            for p in self._read_items():
+                if p.get("id") == project_id:
+                    return self._load_project(p)
         return None
 
     def _mutate_project(
@@ -126,17 +220,25 @@ class ProjectService:
         project_id: str,
         mutator: Callable[[Dict[str, Any]], None],
     ) -> Optional[Dict[str, Any]]:
-        items = self.store.read_list()
-        for i, p in enumerate(items):
-            if p.get("id") != project_id:
-                continue
-            p = self._normalize_project(p)
-            mutator(p)
-            p["updated_at"] = dt.datetime.now().isoformat(timespec="seconds")
-            items[i] = p
-            self.store.write_list(items)
-            return p
-        return None
+        with self._lock:
+            items = self._read_items()
+            for i, p in enumerate(items):
+                if p.get("id") != project_id:
+                    continue
+                p = self._load_project(p)
+                mutator(p)
+                p["updated_at"] = dt.datetime.now().isoformat(timespec="seconds")
+                items[i] = p
+                if self._batch_items is not None:
+                    self._write_items(items)
+                    self._batch_folded.add(project_id)
+                    return p
+                self._write_items(items)
+                # The log's events now live in the store; drop it so they are
+                # not merged twice.
+                self._drop_events_log(project_id)
+                return p
+            return None
 
     @staticmethod
     def _ensure_trace_list(project: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -149,7 +251,6 @@ class ProjectService:
         return []
 
     def create_project(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        items = self.store.read_list()
         now = dt.datetime.now().isoformat(timespec="seconds")
         values = payload.get("variables")
         if values is None:
@@ -187,8 +288,10 @@ class ProjectService:
                 "updated_at": now,
             },
         }
-        items.insert(0, project)
-        self.store.write_list(items)
+        with self._lock:
+            items = self._read_items()
+            items.insert(0, project)
+            self._write_items(items)
         return self._normalize_project(project)
 
     def update_project(self, project_id: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -352,16 +455,52 @@ class ProjectService:
         return self._ensure_trace_list(project)
 
     def append_event(self, project_id: str, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        def _mutate(p: Dict[str, Any]) -> None:
-            trace = self._ensure_trace_list(p)
-            item = dict(event)
-            trace.append(item)
-            if len(trace) > _TRACE_MAX_EVENTS:
-                trace = trace[-_TRACE_MAX_EVENTS:]
-            p["events"] = trace
-            p["trace"] = trace
+        """Append *event* to the project's event log without rewriting the store.
+
+        The 200-event window is applied when the log is read back and when
+        it is folded into the store by the next project mutation.  *event*
+        is serialised straight into the log line, so it is neither copied
+        nor reshaped first.
+        """
+        with self._lock:
+            for p in self._read_items():
+                if p.get("id") != project_id:
+                    continue
+                self._append_to_log(project_id, [event])
+                if project_id in self._batch_folded:
+                    self._extend_pending_events(p, [event])
+                return self._load_project(p)
+        return None
 
-        return self._mutate_project(project_id, _mutate)
+    def append_events_bulk(self, project_id: str, events: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Append several events with one log write.
+
+        Only the newest 200 can survive the window, so older ones are not
+        written at all.
+        """
+        with self._lock:
+            for p in self._read_items():
+                if p.get("id") != project_id:
+                    continue
+                self._append_to_log(project_id, events[-_TRACE_MAX_EVENTS:])
+                if project_id in self._batch_folded:
+                    self._extend_pending_events(p, events[-_TRACE_MAX_EVENTS:])
+                return self._load_project(p)
+        return None
+
+    @staticmethod
+    def _extend_pending_events(project: Dict[str, Any], events: List[Dict[str, Any]]) -> None:
+        """Mirror log appends into a project already folded into a pending batch.
+
+        The log keeps them too, so a failed flush loses nothing.
+        """
+        pending = project["events"]
+        # Deep copies, matching the snapshot the log line holds.
+        pending.extend(copy.deepcopy(events))
+        overflow = len(pending) - _TRACE_MAX_EVENTS
+        if overflow > 0:
+            del pending[:overflow]
+        project["trace"] = pending
 
     def update_progress(
         self,
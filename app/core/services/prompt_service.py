@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from app.core.storage.json_store import JsonStore
 from app.core.utils.id import new_id
 
@@ -9,15 +9,42 @@ class PromptService:
 
     def __init__(self, path: str = "data/prompts.json"):
         self.store = JsonStore(path)
+        # (file stamp, prompts, id -> prompt), swapped in as one tuple.
+        self._cache: Optional[Tuple[Tuple[int, int, int], List[Dict[str, Any]], Dict[Any, Dict[str, Any]]]] = None
+
+    def _file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = self.store.path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _snapshot(self) -> Tuple[List[Dict[str, Any]], Dict[Any, Dict[str, Any]]]:
+        """Decoded prompts and their id index, re-read only when prompts.json changes."""
+        # Stamp before reading: a write racing the read then leaves a
+        # stale stamp, which forces a re-read on the next call.
+        stamp = self._file_stamp()
+        cache = self._cache
+        if stamp is not None and cache is not None and cache[0] == stamp:
+            return cache[1], cache[2]
+        items = self.store.read_list()
+        by_id: Dict[Any, Dict[str, Any]] = {}
+        for p in items:
+            # First entry wins, as the old linear scan did.
+            by_id.setdefault(p.get("id"), p)
+        if stamp is not None:
+            self._cache = (stamp, items, by_id)
+        return items, by_id
 
     def list_prompts(self) -> List[Dict[str, Any]]:
-        return self.store.read_list()
+        """Return every prompt; the list is a copy, the dicts are shared."""
+        items, _ = self._snapshot()
+        return list(items)
 
     def get_prompt(self, prompt_id: str) -> Optional[Dict[str, Any]]:
-        for p in self.store.read_list():
-            if p.get("id") == prompt_id:
-                return p
-        return None
+        """Return the prompt with *prompt_id*; the dict is shared, do not mutate it."""
+        _, by_id = self._snapshot()
+        return by_id.get(prompt_id)
 
     def create_prompt(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         items = self.store.read_list()
@@ -31,6 +58,7 @@ class PromptService:
         }
         items.insert(0, prompt)
         self.store.write_list(items)
+        self._cache = None
         return prompt
 
     def update_prompt(self, prompt_id: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -46,6 +74,7 @@ class PromptService:
                 })
                 items[i] = p
                 self.store.write_list(items)
+                self._cache = None
                 return p
         return None
 
@@ -55,4 +84,5 @@ class PromptService:
         if len(new_items) == len(items):
             return False
         self.store.write_list(new_items)
+        self._cache = None
         return True
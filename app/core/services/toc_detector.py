@@ -14,6 +14,7 @@ Used by:
 from __future__ import annotations
 
 import unicodedata
+from functools import lru_cache
 from typing import Any
 
 # ---------------------------------------------------------------------------
@@ -29,8 +30,10 @@ def normalize_title(value: Any) -> str:
     text = str(value or "").strip().lower()
     if not text:
         return ""
-    ascii_only = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
-    return " ".join(ascii_only.split())
+    if not text.isascii():
+        # NFKD leaves ASCII untouched, so only accented text is decomposed.
+        text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return " ".join(text.split())
 
 
 # ---------------------------------------------------------------------------
@@ -67,10 +70,9 @@ def is_toc_title(title: str) -> bool:
     Does **not** match partial substrings: ``"contenido"`` alone returns
     *False* to avoid flagging real chapter titles.
     """
-    normalized = normalize_title(title)
-    if not normalized:
-        return False
-    return normalized in TOC_TITLES
+    # Coerce the way ``normalize_title`` does, so only hashable str keys
+    # reach the cache.
+    return _is_toc_title(title if type(title) is str else str(title or ""))
 
 
 def is_toc_path(path: str) -> bool:
@@ -80,7 +82,35 @@ def is_toc_path(path: str) -> bool:
     ``"ÍNDICE/I. PLANTEAMIENTO"`` → *True* (first segment matches).
     ``"I. PLANTEAMIENTO/1.1 Problema"`` → *False*.
     """
-    for part in str(path or "").split("/"):
-        if is_toc_title(part):
+    return _is_toc_path(path if type(path) is str else str(path or ""))
+
+
+# The same titles and paths are checked by the compiler, the validator and
+# the router adapter, over and over.  Both predicates are pure functions of
+# the string, so a process-wide cache is safe.
+
+
+@lru_cache(maxsize=2048)
+def _is_toc_title(title: str) -> bool:
+    normalized = normalize_title(title)
+    if not normalized:
+        return False
+    return normalized in TOC_TITLES
+
+
+@lru_cache(maxsize=2048)
+def _is_toc_path(text: str) -> bool:
+    if text.isascii():
+        # One pass over the whole path: lower-case it and check it is
+        # ASCII once, rather than per segment. Collapsing whitespace is
+        # all that ``normalize_title`` has left to do for each segment.
+        for part in text.lower().split("/"):
+            if " ".join(part.split()) in TOC_TITLES:
+                return True
+        return False
+    # Same check as ``is_toc_title`` per segment, minus a call and an empty
+    # check each: "" is never in ``TOC_TITLES``.
+    for part in text.split("/"):
+        if normalize_title(part) in TOC_TITLES:
             return True
     return False
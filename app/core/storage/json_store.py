@@ -1,16 +1,43 @@
 from __future__ import annotations
 
+import collections
 import json
 import logging
+import os
 import threading
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
+
+try:  # Optional faster (de)serializer (``pip install orjson``).
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
 _LOCKS: Dict[str, threading.Lock] = {}
 
 
+def _loads(raw: bytes) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _dumps(items: Any) -> bytes:
+    """Serialise to UTF-8 JSON with 2-space indentation (same layout either way)."""
+    if _orjson is not None:
+        return _orjson.dumps(items, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS)
+    return json.dumps(items, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _dumps_line(item: Any) -> bytes:
+    """Serialise to one compact JSON line, newline included."""
+    if _orjson is not None:
+        return _orjson.dumps(item, option=_orjson.OPT_NON_STR_KEYS | _orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
 def _lock_for(path: Path) -> threading.Lock:
     key = str(path.resolve())
     if key not in _LOCKS:
@@ -37,10 +64,11 @@ class JsonStore:
             if not self.path.exists():
                 self.path.parent.mkdir(parents=True, exist_ok=True)
                 self.path.write_text("[]", encoding="utf-8")
-            raw = self.path.read_text(encoding="utf-8").strip() or "[]"
+            data = self.path.read_bytes().strip() or b"[]"
             try:
-                return json.loads(raw)
-            except json.JSONDecodeError:
+                return _loads(data)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                raw = data.decode("utf-8", errors="replace")
                 # Attempt to recover the first valid JSON array.
                 logger.warning(
                     "Corrupted JSON in %s — attempting recovery", self.path
@@ -49,10 +77,7 @@ class JsonStore:
                     obj, _ = json.JSONDecoder().raw_decode(raw)
                     if isinstance(obj, list):
                         # Auto-heal: rewrite the file with the valid portion.
-                        self.path.write_text(
-                            json.dumps(obj, indent=2, ensure_ascii=False),
-                            encoding="utf-8",
-                        )
+                        self.path.write_bytes(_dumps(obj))
                         logger.info(
                             "Recovered %d items from %s", len(obj), self.path
                         )
@@ -71,7 +96,79 @@ class JsonStore:
         lock = _lock_for(self.path)
         with lock:
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            self.path.write_text(
-                json.dumps(items, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            # Write to a sibling temp file and swap it in, so readers never
+            # observe a half-written list.
+            tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+            tmp_path.write_bytes(_dumps(items))
+            os.replace(tmp_path, self.path)
+
+
+class JsonLinesStore:
+    """Append-only JSON-lines file: one object per line, never rewritten.
+
+    Appends cost O(record) bytes regardless of file size; readers only
+    decode the tail they ask for.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def append(self, item: Dict[str, Any]) -> bytes:
+        """Append *item* and return the encoded line that was written."""
+        line = _dumps_line(item)
+        lock = _lock_for(self.path)
+        with lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("ab") as fh:
+                fh.write(line)
+        return line
+
+    def extend(self, items: List[Dict[str, Any]]) -> List[bytes]:
+        """Append several records with a single open and write.
+
+        Returns the encoded lines that were written.
+        """
+        if not items:
+            return []
+        lines = [_dumps_line(item) for item in items]
+        lock = _lock_for(self.path)
+        with lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("ab") as fh:
+                fh.write(b"".join(lines))
+        return lines
+
+    def tail_lines(self, limit: int) -> List[bytes]:
+        """Return up to the last *limit* encoded lines, undecoded."""
+        lock = _lock_for(self.path)
+        with lock:
+            try:
+                with self.path.open("rb") as fh:
+                    return list(collections.deque(fh, maxlen=max(0, int(limit))))
+            except FileNotFoundError:
+                return []
+
+    def decode(self, lines: Iterable[bytes]) -> List[Dict[str, Any]]:
+        """Decode encoded lines into records; unreadable lines are skipped."""
+        records: List[Dict[str, Any]] = []
+        for line in lines:
+            try:
+                record = _loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                logger.warning("Skipping corrupted line in %s", self.path)
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+        return records
+
+    def tail(self, limit: int) -> List[Dict[str, Any]]:
+        """Return up to the last *limit* records; unreadable lines are skipped."""
+        return self.decode(self.tail_lines(limit))
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def delete(self) -> None:
+        lock = _lock_for(self.path)
+        with lock:
+            self.path.unlink(missing_ok=True)
@@ -17,6 +17,7 @@ import json
 import logging
 import re
 import subprocess
+import sys
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -334,15 +335,15 @@ def _adapt_ai_result_for_gicatesis(ai_result: Optional[Dict[str, Any]]) -> Dict[
     - Keep only canonical paths emitted by the compiler.
     - Do not duplicate leaf paths, which can collide with TOC/index headings.
     """
-    if not isinstance(ai_result, dict):
-        return {"sections": []}
-
-    raw_sections = ai_result.get("sections")
-    if not isinstance(raw_sections, list):
+    raw_sections = ai_result.get("sections") if isinstance(ai_result, dict) else None
+    # One exit for missing, malformed and empty payloads; the result is fresh
+    # because it ends up embedded in render payloads handed to other code.
+    if not raw_sections or not isinstance(raw_sections, list):
         return {"sections": []}
 
     canonical_sections: list[Dict[str, str]] = []
     seen: set[tuple[str, str]] = set()
+    is_toc = _is_toc_path
 
     for section in raw_sections:
         if not isinstance(section, dict):
@@ -360,17 +361,19 @@ def _adapt_ai_result_for_gicatesis(ai_result: Optional[Dict[str, Any]]) -> Dict[
             continue
 
         # Defence-in-depth: drop TOC/index sections that may have leaked.
-        if _is_toc_path(path):
+        if is_toc(path):
             continue
 
-        canonical_id = section_id.strip() if isinstance(section_id, str) and section_id.strip() else ""
+        canonical_id = section_id.strip() if isinstance(section_id, str) else ""
         dedupe_key = (canonical_id or path, path)
         if dedupe_key in seen:
             continue
         seen.add(dedupe_key)
 
+        # Interned only once kept: downstream code keys by path, and payloads
+        # loaded from disk repeat the same strings as separate objects.
         entry: Dict[str, str] = {
-            "path": path,
+            "path": sys.intern(path),
             "content": content,
         }
         if canonical_id:
@@ -381,16 +384,16 @@ def _adapt_ai_result_for_gicatesis(ai_result: Optional[Dict[str, Any]]) -> Dict[
     # when a level-1 section also has child sections, move its content to the
     # first child and omit the parent entry.
     by_path: Dict[str, Dict[str, str]] = {item["path"]: item for item in canonical_sections if item.get("path")}
-    parent_paths_with_children: set[str] = set()
-    for path in by_path.keys():
-        if "/" in path:
-            continue
-        prefix = f"{path}/"
-        if any(other_path.startswith(prefix) for other_path in by_path.keys()):
-            parent_paths_with_children.add(path)
+    # One pass maps each level-1 path to its first child section, instead of
+    # rescanning every section for each parent.
+    first_child_by_parent: Dict[str, Dict[str, str]] = {}
+    for item in canonical_sections:
+        parent_path, sep, _ = item.get("path", "").partition("/")
+        if sep:
+            first_child_by_parent.setdefault(parent_path, item)
 
     paths_to_drop: set[str] = set()
-    for parent_path in parent_paths_with_children:
+    for parent_path, first_child in first_child_by_parent.items():
         parent_entry = by_path.get(parent_path)
         if not parent_entry:
             continue
@@ -399,19 +402,11 @@ def _adapt_ai_result_for_gicatesis(ai_result: Optional[Dict[str, Any]]) -> Dict[
             paths_to_drop.add(parent_path)
             continue
 
-        first_child: Optional[Dict[str, str]] = None
-        child_prefix = f"{parent_path}/"
-        for item in canonical_sections:
-            item_path = item.get("path", "")
-            if item_path.startswith(child_prefix):
-                first_child = item
-                break
-        if first_child is not None:
-            child_content = str(first_child.get("content") or "").strip()
-            if child_content:
-                first_child["content"] = f"{parent_content}\n\n{child_content}"
-            else:
-                first_child["content"] = parent_content
+        child_content = str(first_child.get("content") or "").strip()
+        if child_content:
+            first_child["content"] = f"{parent_content}\n\n{child_content}"
+        else:
+            first_child["content"] = parent_content
         paths_to_drop.add(parent_path)
 
     if paths_to_drop:
@@ -1048,7 +1043,6 @@ async def sim_download_docx(projectId: str, runId: Optional[str] = None):
     project_values = project.get("values") if isinstance(project.get("values"), dict) else {}
     values = _values_with_title(project, project_values)
     ai_result_raw = project.get("ai_result") if isinstance(project.get("ai_result"), dict) else {"sections": []}
-    ai_result = _adapt_ai_result_for_gicatesis(ai_result_raw)
 
     url = f"{settings.GICATESIS_BASE_URL.rstrip('/')}/render/docx"
     payload: Dict[str, Any] = _build_render_payload(
@@ -1056,6 +1050,8 @@ async def sim_download_docx(projectId: str, runId: Optional[str] = None):
         values=values,
         ai_result_raw=ai_result_raw,
     )
+    # Already adapted by _build_render_payload; reuse it instead of adapting twice.
+    ai_result = payload["aiResult"]
     _emit_project_trace(
         projectId,
         step="gicatesis.payload",
@@ -1145,7 +1141,6 @@ async def sim_download_pdf(projectId: str, runId: Optional[str] = None):
     project_values = project.get("values") if isinstance(project.get("values"), dict) else {}
     values = _values_with_title(project, project_values)
     ai_result_raw = project.get("ai_result") if isinstance(project.get("ai_result"), dict) else {"sections": []}
-    ai_result = _adapt_ai_result_for_gicatesis(ai_result_raw)
 
     url = f"{settings.GICATESIS_BASE_URL.rstrip('/')}/render/pdf"
     payload: Dict[str, Any] = _build_render_payload(
@@ -1153,6 +1148,8 @@ async def sim_download_pdf(projectId: str, runId: Optional[str] = None):
         values=values,
         ai_result_raw=ai_result_raw,
     )
+    # Already adapted by _build_render_payload; reuse it instead of adapting twice.
+    ai_result = payload["aiResult"]
     _emit_project_trace(
         projectId,
         step="gicatesis.payload",
@@ -13,6 +13,7 @@ LINT_TARGETS: list[str] = [
     "tests/test_ai_service.py",
     "tests/test_api_integration.py",
     "tests/test_gemini_client.py",
+    "tests/test_gemini_client_retries.py",
     "scripts/check_encoding.py",
     "scripts/check_mojibake.py",
 ]
@@ -0,0 +1,68 @@
+"""Lightweight HTTP test doubles shared by the provider client tests.
+
+Plain objects instead of ``MagicMock`` keep attribute access cheap and make
+unexpected attribute use fail loudly instead of returning another mock.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+
+@dataclass
+class FakeResponse:
+    """Minimal ``requests.Response`` stand-in."""
+
+    status_code: int
+    payload: Any = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    text: str = ""
+
+    @property
+    def content(self) -> bytes:
+        if self.payload is None:
+            return self.text.encode("utf-8")
+        return json.dumps(self.payload).encode("utf-8")
+
+    def json(self) -> Any:
+        if self.payload is None:
+            raise ValueError("No JSON body")
+        return self.payload
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+
+class FakeSession:
+    """``requests.Session`` stand-in that returns canned responses.
+
+    ``post_response`` answers ``post()``; ``get_response`` answers ``get()``.
+    Every call is recorded in ``calls`` as ``(method, url, kwargs)``.
+    """
+
+    def __init__(
+        self,
+        post_response: Optional[FakeResponse] = None,
+        *,
+        get_response: Optional[FakeResponse] = None,
+    ) -> None:
+        self.post_response = post_response
+        self.get_response = get_response
+        self.calls: List[Tuple[str, str, Dict[str, Any]]] = []
+        self.closed = False
+
+    def post(self, url: str, **kwargs: Any) -> Optional[FakeResponse]:
+        self.calls.append(("POST", url, kwargs))
+        return self.post_response
+
+    def get(self, url: str, **kwargs: Any) -> Optional[FakeResponse]:
+        self.calls.append(("GET", url, kwargs))
+        return self.get_response
+
+    def close(self) -> None:
+        self.closed = True
@@ -1,9 +1,108 @@
 """Shared test fixtures for GicaGen tests."""
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
 
 # Ensure the project root is in sys.path so that `app.*` imports work
 # when running pytest from the repo root.
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@pytest.fixture(scope="session")
+def app():
+    """FastAPI application, imported once per test session (per xdist worker)."""
+    from app.main import app as fastapi_app
+
+    return fastapi_app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Shared TestClient bound to the session-wide FastAPI app."""
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def output_validator():
+    """One ``OutputValidator`` for the session; the validator keeps no per-run state."""
+    from app.core.services.ai.output_validator import OutputValidator
+
+    return OutputValidator()
+
+
+@pytest.fixture(scope="session")
+def prompt_renderer():
+    """One ``PromptRenderer`` for the session; rendering keeps no state."""
+    from app.core.services.ai.prompt_renderer import PromptRenderer
+
+    return PromptRenderer()
+
+
+@pytest.fixture(scope="session")
+def real_prompt_service():
+    """``PromptService`` over the shipped ``data/prompts.json``, parsed once per session.
+
+    Tests must only read through it; use ``tmp_path`` for CRUD checks.
+    """
+    from app.core.services.prompt_service import PromptService
+
+    return PromptService(path=str(PROJECT_ROOT / "data" / "prompts.json"))
+
+
+@pytest.fixture(scope="session")
+def real_prompts(real_prompt_service):
+    """The shipped prompt templates, loaded once per session."""
+    return real_prompt_service.list_prompts()
+
+
+@pytest.fixture
+def service_factory(tmp_path):
+    """Build ``ProjectService`` instances backed by files under ``tmp_path``.
+
+    Each call returns a fresh service, so calling it again with the same
+    name reloads whatever an earlier service wrote.
+    """
+    from app.core.services.project_service import ProjectService
+
+    def _make(name: str = "projects.json"):
+        return ProjectService(str(tmp_path / name))
+
+    return _make
+
+
+@pytest.fixture
+def mistral_settings(monkeypatch):
+    """Swap ``mistral_client.settings`` for a plain, per-test namespace."""
+    ns = SimpleNamespace(
+        MISTRAL_API_KEY="mistral-key",
+        MISTRAL_BASE_URL="https://api.mistral.ai/v1",
+        MISTRAL_MODEL="mistral-medium-2505",
+        MISTRAL_TEMPERATURE=0.7,
+        MISTRAL_MAX_TOKENS=2048,
+        MISTRAL_RETRY_MAX=1,
+        MISTRAL_RETRY_BACKOFF=0.01,
+        MAX_INFLIGHT_MISTRAL=3,
+    )
+    monkeypatch.setattr("app.core.services.ai.mistral_client.settings", ns)
+    return ns
+
+
+@pytest.fixture
+def openrouter_settings(monkeypatch):
+    """Swap ``openrouter_client.settings`` for a plain, per-test namespace."""
+    ns = SimpleNamespace(
+        OPENROUTER_API_KEY="or-key",
+        OPENROUTER_BASE_URL="https://openrouter.ai/api/v1",
+        OPENROUTER_MODEL="openai/gpt-oss-120b:free",
+        OPENROUTER_TIMEOUT_SECONDS=30,
+        OPENROUTER_HTTP_REFERER="",
+        OPENROUTER_APP_TITLE="",
+        MAX_INFLIGHT_OPENROUTER=3,
+    )
+    monkeypatch.setattr("app.core.services.ai.openrouter_client.settings", ns)
+    return ns
@@ -4,18 +4,6 @@ import asyncio
 import time
 from unittest.mock import AsyncMock, patch
 
-import pytest
-from fastapi.testclient import TestClient
-
-from app.main import app
-
-
-@pytest.fixture
-def client():
-    """Provide a TestClient instance for the FastAPI app."""
-    return TestClient(app)
-
-
 # =============================================================================
 # HEALTH ENDPOINTS
 # =============================================================================
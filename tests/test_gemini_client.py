@@ -8,6 +8,14 @@ from app.core.services.ai.errors import ProviderAuthError, QuotaExceededError
 from app.core.services.ai.gemini_client import GeminiClient
 
 
+@pytest.fixture(autouse=True)
+def _no_sleep():
+    """Single-shot paths never need real backoff; retry timing lives in
+    test_gemini_client_retries.py."""
+    with patch("app.core.services.ai.gemini_client.time.sleep"):
+        yield
+
+
 class TestIsConfigured:
     def test_configured_when_key_set(self):
         with patch("app.core.services.ai.gemini_client.settings") as s:
@@ -51,45 +59,6 @@ class TestGenerate:
         assert result == "Generated content here."
         mock_model.generate_content.assert_called_once()
 
-    @patch("app.core.services.ai.gemini_client.time.sleep")
-    @patch("app.core.services.ai.gemini_client.settings")
-    def test_retries_on_error_then_succeeds(self, mock_settings, mock_sleep):
-        mock_settings.GEMINI_API_KEY = "key"
-        mock_settings.GEMINI_RETRY_MAX = 3
-        mock_settings.GEMINI_RETRY_BACKOFF = 2.0
-
-        client, mock_model = self._make_client_with_mock_model()
-
-        # Fail twice, succeed third time
-        mock_response = MagicMock()
-        mock_response.text = "Success on retry."
-        mock_model.generate_content.side_effect = [
-            RuntimeError("API Error 1"),
-            RuntimeError("API Error 2"),
-            mock_response,
-        ]
-
-        result = client.generate("Retry prompt")
-        assert result == "Success on retry."
-        assert mock_model.generate_content.call_count == 3
-        # Verify backoff was called
-        assert mock_sleep.call_count == 2
-
-    @patch("app.core.services.ai.gemini_client.time.sleep")
-    @patch("app.core.services.ai.gemini_client.settings")
-    def test_exhausts_retries_raises_error(self, mock_settings, mock_sleep):
-        mock_settings.GEMINI_API_KEY = "key"
-        mock_settings.GEMINI_RETRY_MAX = 3
-        mock_settings.GEMINI_RETRY_BACKOFF = 0.01
-
-        client, mock_model = self._make_client_with_mock_model()
-        mock_model.generate_content.side_effect = RuntimeError("Persistent error")
-
-        with pytest.raises(RuntimeError, match="failed after 3 attempts"):
-            client.generate("Failing prompt")
-
-        assert mock_model.generate_content.call_count == 3
-
     @patch("app.core.services.ai.gemini_client.settings")
     def test_quota_error_raises_custom_exception(self, mock_settings):
         mock_settings.GEMINI_API_KEY = "key"
@@ -127,7 +96,7 @@ class TestGenerate:
         exc = exc_info.value
         assert exc.provider == "gemini"
         assert exc.error_type == "rate_limited"
-        assert exc.retry_after == pytest.approx(8.0, rel=1e-3)
+        assert 7.99 <= exc.retry_after <= 8.01
 
     @patch("app.core.services.ai.gemini_client.settings")
     def test_auth_error_raises_provider_auth_error(self, mock_settings):
@@ -141,9 +110,8 @@ class TestGenerate:
         with pytest.raises(ProviderAuthError):
             client.generate("Auth prompt")
 
-    @patch("app.core.services.ai.gemini_client.time.sleep")
     @patch("app.core.services.ai.gemini_client.settings")
-    def test_retries_on_empty_content(self, mock_settings, mock_sleep):
+    def test_retries_on_empty_content(self, mock_settings):
         mock_settings.GEMINI_API_KEY = "key"
         mock_settings.GEMINI_RETRY_MAX = 2
         mock_settings.GEMINI_RETRY_BACKOFF = 0.01
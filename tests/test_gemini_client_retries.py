@@ -0,0 +1,59 @@
+"""Retry/backoff tests for app.core.services.ai.gemini_client (with mocked SDK).
+
+Kept apart from test_gemini_client.py so the sleep-counting retry paths can
+be scheduled independently of the fast single-shot tests.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.services.ai.gemini_client import GeminiClient
+
+
+class TestGenerateRetries:
+    def _make_client_with_mock_model(self):
+        """Helper: return (client, mock_model) with settings patched."""
+        client = GeminiClient()
+        mock_model = MagicMock()
+        client._model = mock_model  # skip lazy init
+        return client, mock_model
+
+    @patch("app.core.services.ai.gemini_client.time.sleep")
+    @patch("app.core.services.ai.gemini_client.settings")
+    def test_retries_on_error_then_succeeds(self, mock_settings, mock_sleep):
+        mock_settings.GEMINI_API_KEY = "key"
+        mock_settings.GEMINI_RETRY_MAX = 3
+        mock_settings.GEMINI_RETRY_BACKOFF = 2.0
+
+        client, mock_model = self._make_client_with_mock_model()
+
+        # Fail twice, succeed third time
+        mock_response = MagicMock()
+        mock_response.text = "Success on retry."
+        mock_model.generate_content.side_effect = [
+            RuntimeError("API Error 1"),
+            RuntimeError("API Error 2"),
+            mock_response,
+        ]
+
+        result = client.generate("Retry prompt")
+        assert result == "Success on retry."
+        assert mock_model.generate_content.call_count == 3
+        # Verify backoff was called
+        assert mock_sleep.call_count == 2
+
+    @patch("app.core.services.ai.gemini_client.time.sleep")
+    @patch("app.core.services.ai.gemini_client.settings")
+    def test_exhausts_retries_raises_error(self, mock_settings, mock_sleep):
+        mock_settings.GEMINI_API_KEY = "key"
+        mock_settings.GEMINI_RETRY_MAX = 3
+        mock_settings.GEMINI_RETRY_BACKOFF = 0.01
+
+        client, mock_model = self._make_client_with_mock_model()
+        mock_model.generate_content.side_effect = RuntimeError("Persistent error")
+
+        with pytest.raises(RuntimeError, match="failed after 3 attempts"):
+            client.generate("Failing prompt")
+
+        assert mock_model.generate_content.call_count == 3
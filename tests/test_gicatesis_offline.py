@@ -5,30 +5,19 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from fastapi.testclient import TestClient
 
 from app.core.services.gicatesis_status import GicaTesisStatus, gicatesis_status
 from app.integrations.gicatesis.errors import UpstreamUnavailable
-from app.main import app
-
-
-@pytest.fixture
-def client():
-    return TestClient(app)
 
 
 @pytest.fixture(autouse=True)
 def _reset_gicatesis_status():
-    """Reset module-level singleton before each test."""
-    gicatesis_status.online = True
-    gicatesis_status.last_success_at = None
-    gicatesis_status.last_error = None
-    gicatesis_status.data_source = "none"
+    """Reset module-level singleton before each test (only when touched)."""
+    if gicatesis_status._dirty:
+        gicatesis_status.reset()
     yield
-    gicatesis_status.online = True
-    gicatesis_status.last_success_at = None
-    gicatesis_status.last_error = None
-    gicatesis_status.data_source = "none"
+    if gicatesis_status._dirty:
+        gicatesis_status.reset()
 
 
 # ---------------------------------------------------------------------------
@@ -52,6 +41,17 @@ class TestGicaTesisStatusUnit:
         assert st.data_source == "cache"
         assert st.last_error == "connection refused"
 
+    def test_reset_clears_dirty_state(self):
+        st = GicaTesisStatus()
+        assert st._dirty is False
+        st.record_failure("timeout")
+        assert st._dirty is True
+        st.reset()
+        assert st._dirty is False
+        assert st.online is True
+        assert st.last_error is None
+        assert st.data_source == "none"
+
     def test_to_dict(self):
         st = GicaTesisStatus()
         st.record_failure("timeout")
@@ -204,6 +204,8 @@ class TestFormatsEndpointPolicyB:
 class TestAssetsEndpoint:
     def test_asset_offline_known_returns_503(self, client):
         """When gicatesis_status is offline, asset proxy returns 503 immediately."""
+        # No HTTP mocking on purpose: record_failure() flips the singleton
+        # offline and proxy_asset short-circuits before creating any client.
         gicatesis_status.record_failure("down")
         r = client.get("/api/assets/logos/test.png")
         assert r.status_code == 503
@@ -216,20 +218,21 @@ class TestAssetsEndpoint:
 
         gicatesis_status.record_success()  # online, but network fails
 
+        def _refuse(request):
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        real_async_client = httpx.AsyncClient
+        transport = httpx.MockTransport(_refuse)
+
         with patch(
             "app.modules.api.router.httpx.AsyncClient",
-        ) as MockAsyncClient:
-            mock_client = AsyncMock()
-            mock_client.get.side_effect = httpx.ConnectError("Connection refused")
-            mock_ctx = AsyncMock()
-            mock_ctx.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_ctx.__aexit__ = AsyncMock(return_value=False)
-            MockAsyncClient.return_value = mock_ctx
-
+            lambda **kwargs: real_async_client(transport=transport, **kwargs),
+        ):
             r = client.get("/api/assets/logos/test.png")
 
         assert r.status_code == 503
         assert "502" not in str(r.status_code)
+        assert gicatesis_status.online is False
 
     def test_asset_404_still_returns_404(self, client):
         """Asset not found should still be 404."""
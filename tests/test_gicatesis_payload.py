@@ -1,8 +1,20 @@
 """Tests for build_gicatesis_payload hierarchical assembly."""
 
+from types import MappingProxyType
+
 from app.core.services.gicatesis_payload import build_gicatesis_payload
 
-SAMPLE_FORMAT = {
+
+def _freeze(obj):
+    """Recursively wrap dicts/lists so any in-place write raises TypeError."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(x) for x in obj)
+    return obj
+
+
+SAMPLE_FORMAT = _freeze({
     "preliminares": {
         "indices": [
             {
@@ -31,7 +43,7 @@ SAMPLE_FORMAT = {
             ],
         },
     ],
-}
+})
 
 
 def test_injects_introduccion_desarrollo():
@@ -105,10 +117,8 @@ def test_does_not_mutate_original():
         {"sectionId": "sec-0001", "path": "INTRODUCCIÓN", "content": "Generado."},
     ]
 
-    import copy
-
-    original = copy.deepcopy(SAMPLE_FORMAT)
-    build_gicatesis_payload(SAMPLE_FORMAT, ai_sections)
+    # SAMPLE_FORMAT is frozen: any write into the original raises TypeError.
+    result = build_gicatesis_payload(SAMPLE_FORMAT, ai_sections)
 
-    # Original format untouched
-    assert SAMPLE_FORMAT == original
+    assert isinstance(result, dict)
+    assert "desarrollo" not in SAMPLE_FORMAT["preliminares"]["introduccion"]
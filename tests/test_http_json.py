@@ -0,0 +1,36 @@
+"""Tests for the shared provider JSON decoding helpers."""
+
+import pytest
+import requests
+
+from app.core.services.ai.http_json import decode_json, safe_decode_json
+
+
+def _response(body: bytes, *, encoding=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.encoding = encoding
+    return response
+
+
+def test_decode_json_utf8_body():
+    assert decode_json(_response(b'{"message": "hola"}')) == {"message": "hola"}
+
+
+def test_decode_json_falls_back_for_non_utf8_charset():
+    body = '{"message": "año"}'.encode("latin-1")
+
+    assert decode_json(_response(body, encoding="latin-1")) == {"message": "año"}
+
+
+def test_decode_json_falls_back_for_nan_literal():
+    decoded = decode_json(_response(b'{"score": NaN}'))
+
+    assert decoded["score"] != decoded["score"]
+
+
+def test_decode_json_raises_and_safe_variant_returns_none_for_non_json():
+    with pytest.raises(ValueError):
+        decode_json(_response(b"<html>Bad gateway</html>"))
+    assert safe_decode_json(_response(b"<html>Bad gateway</html>")) is None
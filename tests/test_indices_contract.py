@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import copy
 
+import pytest
+
 from app.core.services.content_sanitizer import (
     has_leader_page_pattern,
     sanitize_text_block,
@@ -53,6 +55,12 @@ class TestNormalizeIndicesDict:
         assert len(result) == 1
         assert all(d.get("placeholder") is None for d in result)
 
+    def test_tabla_de_contenido_is_main_toc(self):
+        result = normalize_indices({"contenido": "TABLA DE CONTENIDO", "tablas": "Índice de Tablas y Cuadros"})
+        assert result is not None
+        assert result[0]["type"] == "toc"
+        assert result[1]["type"] == "toc_tables"
+
 
 class TestNormalizeIndicesArray:
     """Array-style indices (Variant B) — the problematic format."""
@@ -151,6 +159,18 @@ class TestNormalizeDefinition:
         assert indices[0]["type"] == "toc"
         assert indices[1]["type"] == "toc_tables"
 
+    def test_untouched_branches_are_shared(self):
+        definition = {
+            "preliminares": {"indices": {"contenido": "ÍNDICE"}, "introduccion": {"titulo": "INTRODUCCIÓN"}},
+            "cuerpo": [{"titulo": "I. PLANTEAMIENTO"}],
+        }
+        result = normalize_definition(definition)
+        assert result is not definition
+        assert result["preliminares"] is not definition["preliminares"]
+        assert result["cuerpo"] is definition["cuerpo"]
+        assert result["preliminares"]["introduccion"] is definition["preliminares"]["introduccion"]
+        assert isinstance(definition["preliminares"]["indices"], dict)
+
     def test_no_indices_passes_through(self):
         definition = {"cuerpo": [{"titulo": "Test"}]}
         result = normalize_definition(definition)
@@ -172,6 +192,10 @@ class TestHasLeaderPagePattern:
     def test_with_pag_x(self):
         assert has_leader_page_pattern("Tabla 1.1. Datos ......... pag X")
 
+    def test_pag_suffix_any_case(self):
+        assert has_leader_page_pattern("Figura 2 PAG 14")
+        assert has_leader_page_pattern("Figura 2 Pag. x")
+
     def test_with_spaces_and_number(self):
         assert has_leader_page_pattern("INTRODUCCIÓN          5")
 
@@ -185,6 +209,19 @@ class TestHasLeaderPagePattern:
         """Two dots (like abbreviation) should NOT match."""
         assert not has_leader_page_pattern("Dr.. Smith")
 
+    def test_long_blank_run_does_not_backtrack(self):
+        """A long space run with no page number must fail fast (no ReDoS)."""
+        assert not has_leader_page_pattern("a" + " " * 1000 + "b")
+
+    def test_non_ascii_decimal_page_numbers(self):
+        assert has_leader_page_pattern("Cap ..... \uff11\uff12")
+        assert strip_leader_page("Cap ..... \u0663") == "Cap"
+        assert sanitize_text_block("Cap pag \u0663\nCap ..... 3") == "Cap\nCap"
+
+    def test_nbsp_between_leader_and_page(self):
+        assert has_leader_page_pattern("Intro ...\xa028")
+        assert has_leader_page_pattern("Intro ....\xa0pag\xa012")
+
 
 class TestStripLeaderPage:
     def test_strip_dots_and_number(self):
@@ -193,6 +230,11 @@ class TestStripLeaderPage:
     def test_strip_pag_x(self):
         assert strip_leader_page("Tabla 1.1. Datos ... pag X") == "Tabla 1.1. Datos"
 
+    def test_strip_nbsp_separated_page(self):
+        assert strip_leader_page("Intro ...\xa028") == "Intro"
+        assert strip_leader_page("Intro ....\xa0pag\xa012") == "Intro"
+        assert strip_leader_page("Intro ...\u3000pag. 3") == "Intro"
+
     def test_clean_line_unchanged(self):
         line = "Este es un párrafo normal."
         assert strip_leader_page(line) == line
@@ -216,35 +258,55 @@ class TestSanitizeTextBlock:
         assert "Heading" in result
         assert "Another" in result
 
+    def test_blank_lines_collapsed_and_trimmed(self):
+        text = "\n\nÍNDICE ..... 1\n\n\n\nContenido\n\n"
+        assert sanitize_text_block(text) == "ÍNDICE\n\nContenido"
+
+    def test_every_splitlines_boundary_is_a_line_break(self):
+        assert sanitize_text_block("Linea\x0bB .... 3") == "Linea\nB"
+        assert sanitize_text_block("Linea\x0cB .... 3\r\nC") == "Linea\nB\nC"
+        assert sanitize_text_block("Titulo\u2028Otro .... 5") == "Titulo\nOtro"
+
 
 # -----------------------------------------------------------------------
 # Compiler with normalised indices
 # -----------------------------------------------------------------------
 
 
+DICT_INDICES_DEFINITION = {
+    "preliminares": {
+        "indices": {
+            "contenido": "ÍNDICE DE CONTENIDO",
+            "tablas": "ÍNDICE DE TABLAS",
+            "figuras": "ÍNDICE DE FIGURAS",
+            "abreviaturas": "ÍNDICE DE ABREVIATURAS",
+            "placeholder": "(Generarlo)",
+        }
+    },
+    "cuerpo": [{"titulo": "I. PLANTEAMIENTO"}],
+}
+
+
+@pytest.fixture(scope="module")
+def dict_indices_ir():
+    """Compile DICT_INDICES_DEFINITION once; tests only read the result."""
+    return compile_definition_to_ir(DICT_INDICES_DEFINITION)
+
+
 class TestCompilerWithTocDirectives:
     """compile_definition_to_ir should emit TOC/list nodes from directives."""
 
-    def test_dict_indices_produce_toc_node(self):
-        definition = {
-            "preliminares": {
-                "indices": {
-                    "contenido": "ÍNDICE DE CONTENIDO",
-                    "tablas": "ÍNDICE DE TABLAS",
-                    "figuras": "ÍNDICE DE FIGURAS",
-                    "abreviaturas": "ÍNDICE DE ABREVIATURAS",
-                    "placeholder": "(Generarlo)",
-                }
-            },
-            "cuerpo": [{"titulo": "I. PLANTEAMIENTO"}],
-        }
-        ir = compile_definition_to_ir(definition)
-        node_types = [n.node_type for n in ir.nodes]
+    def test_dict_indices_produce_toc_node(self, dict_indices_ir):
+        node_types = [n.node_type for n in dict_indices_ir.nodes]
         assert IRNodeType.TOC_PLACEHOLDER in node_types
         assert IRNodeType.LIST_TABLES in node_types
-        assert IRNodeType.LIST_FIGURES in node_types
         assert IRNodeType.LIST_ABBREVIATIONS in node_types
 
+    def test_dict_indices_has_list_figures(self, dict_indices_ir):
+        figures = [n for n in dict_indices_ir.nodes if n.node_type == IRNodeType.LIST_FIGURES]
+        assert len(figures) == 1
+        assert figures[0].text == "ÍNDICE DE FIGURAS"
+
     def test_array_indices_produce_toc_node(self):
         definition = {
             "preliminares": {
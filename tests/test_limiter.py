@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import threading
-import time
 
 from app.core.services.ai.limiter import LLMLimiter
 
@@ -15,14 +14,14 @@ def test_limiter_blocks_when_provider_concurrency_reached() -> None:
         max_inflight_per_tenant=0,
     )
 
-    release_first = threading.Event()
-    first_entered = threading.Event()
+    # Two rendezvous with the first worker: "slot held" and "release slot".
+    barrier = threading.Barrier(2)
     second_entered = threading.Event()
 
     def first_worker() -> None:
         with limiter.acquire_sync("mistral", tenant_id="tenant-a"):
-            first_entered.set()
-            release_first.wait(timeout=2)
+            barrier.wait(timeout=0.5)
+            barrier.wait(timeout=0.5)
 
     def second_worker() -> None:
         with limiter.acquire_sync("mistral", tenant_id="tenant-b"):
@@ -31,33 +30,58 @@ def test_limiter_blocks_when_provider_concurrency_reached() -> None:
     t1 = threading.Thread(target=first_worker, daemon=True)
     t2 = threading.Thread(target=second_worker, daemon=True)
     t1.start()
-    assert first_entered.wait(timeout=1.0)
+    barrier.wait(timeout=0.5)
 
     t2.start()
-    time.sleep(0.1)
+    assert limiter.wait_queue_depth("mistral", 1, timeout=0.5)
     assert second_entered.is_set() is False
-    assert limiter.queue_depth("mistral") >= 1
 
-    release_first.set()
-    t1.join(timeout=1.0)
-    t2.join(timeout=1.0)
+    barrier.wait(timeout=0.5)
+    t1.join(timeout=0.5)
+    t2.join(timeout=0.5)
     assert second_entered.is_set() is True
 
 
+def test_wait_queue_depth_times_out_when_nobody_waits() -> None:
+    limiter = LLMLimiter(provider_concurrency={"mistral": 1}, provider_rpm={"mistral": 60})
+
+    assert limiter.wait_queue_depth("mistral", 1, timeout=0.01) is False
+    assert limiter.wait_queue_depth("mistral", 0, timeout=0.01) is True
+
+
+class _FakeClock:
+    """Virtual monotonic clock whose ``sleep`` advances time instantly."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
 def test_limiter_enforces_provider_rpm_window() -> None:
+    clock = _FakeClock()
     limiter = LLMLimiter(
         provider_concurrency={"mistral": 2},
         provider_rpm={"mistral": 1},
         max_inflight_per_tenant=0,
         rate_window_seconds=1.0,
+        time_fn=clock.monotonic,
+        sleep_fn=clock.sleep,
     )
 
-    started = time.monotonic()
     with limiter.acquire_sync("mistral", tenant_id="tenant-a"):
         pass
+    assert clock.sleeps == []
     with limiter.acquire_sync("mistral", tenant_id="tenant-a"):
         pass
-    elapsed = time.monotonic() - started
 
-    # One request/min-window means second call must wait for the sliding window.
-    assert elapsed >= 0.9
+    # One request per window means the second call must wait out the sliding
+    # window; the virtual clock makes that wait instant.
+    assert clock.now >= 1.0
+    assert clock.sleeps
@@ -1,43 +1,34 @@
 """Tests for app.core.services.ai.openrouter_client (mocked HTTP client)."""
 
-from unittest.mock import MagicMock, patch
-
 import pytest
 
 from app.core.services.ai.errors import ProviderAuthError, ProviderTransientError, QuotaExceededError
 from app.core.services.ai.openrouter_client import OpenRouterClient
+from tests._fakes import FakeResponse, FakeSession
 
 
 class TestOpenRouterClient:
-    @patch("app.core.services.ai.openrouter_client.settings")
-    def test_is_configured(self, mock_settings):
-        mock_settings.OPENROUTER_API_KEY = "or-key"
+    def test_is_configured(self, openrouter_settings):
         assert OpenRouterClient().is_configured() is True
 
-    @patch("app.core.services.ai.openrouter_client.settings")
-    def test_generate_success(self, mock_settings):
-        mock_settings.OPENROUTER_API_KEY = "or-key"
-        mock_settings.OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
-        mock_settings.OPENROUTER_MODEL = "openai/gpt-oss-120b:free"
-        mock_settings.OPENROUTER_TIMEOUT_SECONDS = 30
-        mock_settings.OPENROUTER_HTTP_REFERER = "http://localhost"
-        mock_settings.OPENROUTER_APP_TITLE = "GicaGen"
-
-        response = MagicMock()
-        response.status_code = 200
-        response.raise_for_status.return_value = None
-        response.json.return_value = {
-            "choices": [
-                {
-                    "message": {
-                        "content": "Texto generado por OpenRouter.",
+    def test_generate_success(self, openrouter_settings):
+        openrouter_settings.OPENROUTER_HTTP_REFERER = "http://localhost"
+        openrouter_settings.OPENROUTER_APP_TITLE = "GicaGen"
+
+        response = FakeResponse(
+            200,
+            {
+                "choices": [
+                    {
+                        "message": {
+                            "content": "Texto generado por OpenRouter.",
+                        }
                     }
-                }
-            ]
-        }
+                ]
+            },
+        )
 
-        mock_session = MagicMock()
-        mock_session.post.return_value = response
+        mock_session = FakeSession(response)
 
         client = OpenRouterClient()
         client._session = mock_session
@@ -45,131 +36,79 @@ class TestOpenRouterClient:
         result = client.generate("Prompt de prueba")
         assert result == "Texto generado por OpenRouter."
 
-    @patch("app.core.services.ai.openrouter_client.settings")
-    def test_generate_auth_error(self, mock_settings):
-        mock_settings.OPENROUTER_API_KEY = "or-key"
-        mock_settings.OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
-        mock_settings.OPENROUTER_MODEL = "openai/gpt-oss-120b:free"
-        mock_settings.OPENROUTER_TIMEOUT_SECONDS = 30
-        mock_settings.OPENROUTER_HTTP_REFERER = ""
-        mock_settings.OPENROUTER_APP_TITLE = ""
-
-        response = MagicMock()
-        response.status_code = 401
-        response.json.return_value = {"error": {"message": "Unauthorized"}}
-
-        mock_session = MagicMock()
-        mock_session.post.return_value = response
-
+    @pytest.mark.parametrize(
+        ("status", "payload", "headers", "expected_exc", "attrs"),
+        [
+            pytest.param(401, {"error": {"message": "Unauthorized"}}, {}, ProviderAuthError, {}, id="auth"),
+            pytest.param(
+                402,
+                {"error": {"message": "Payment required"}},
+                {},
+                QuotaExceededError,
+                {"provider": "openrouter", "status_code": 402, "error_type": "exhausted"},
+                id="credits-exhausted",
+            ),
+            pytest.param(
+                429,
+                {"error": {"message": "Rate limit exceeded"}},
+                {"Retry-After": "9"},
+                QuotaExceededError,
+                {"provider": "openrouter", "error_type": "rate_limited", "retry_after": 9.0},
+                id="rate-limited",
+            ),
+            pytest.param(
+                503, {"error": {"message": "Service unavailable"}}, {}, ProviderTransientError, {}, id="5xx-transient"
+            ),
+        ],
+    )
+    def test_generate_error_status(self, openrouter_settings, status, payload, headers, expected_exc, attrs):
         client = OpenRouterClient()
-        client._session = mock_session
-
-        with pytest.raises(ProviderAuthError):
-            client.generate("Prompt auth")
-
-    @patch("app.core.services.ai.openrouter_client.settings")
-    def test_generate_credits_exhausted(self, mock_settings):
-        mock_settings.OPENROUTER_API_KEY = "or-key"
-        mock_settings.OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
-        mock_settings.OPENROUTER_MODEL = "openai/gpt-oss-120b:free"
-        mock_settings.OPENROUTER_TIMEOUT_SECONDS = 30
-        mock_settings.OPENROUTER_HTTP_REFERER = ""
-        mock_settings.OPENROUTER_APP_TITLE = ""
-
-        response = MagicMock()
-        response.status_code = 402
-        response.json.return_value = {"error": {"message": "Payment required"}}
-
-        mock_session = MagicMock()
-        mock_session.post.return_value = response
-
-        client = OpenRouterClient()
-        client._session = mock_session
+        client._session = FakeSession(FakeResponse(status, payload, headers=headers))
 
-        with pytest.raises(QuotaExceededError) as exc_info:
-            client.generate("Prompt sin creditos")
+        with pytest.raises(expected_exc) as exc_info:
+            client.generate("Prompt error")
 
         exc = exc_info.value
-        assert exc.provider == "openrouter"
-        assert exc.status_code == 402
-        assert exc.error_type == "exhausted"
-
-    @patch("app.core.services.ai.openrouter_client.settings")
-    def test_generate_rate_limited_with_retry_after(self, mock_settings):
-        mock_settings.OPENROUTER_API_KEY = "or-key"
-        mock_settings.OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
-        mock_settings.OPENROUTER_MODEL = "openai/gpt-oss-120b:free"
-        mock_settings.OPENROUTER_TIMEOUT_SECONDS = 30
-        mock_settings.OPENROUTER_HTTP_REFERER = ""
-        mock_settings.OPENROUTER_APP_TITLE = ""
-
-        response = MagicMock()
-        response.status_code = 429
-        response.headers = {"Retry-After": "9"}
-        response.json.return_value = {"error": {"message": "Rate limit exceeded"}}
-
-        mock_session = MagicMock()
-        mock_session.post.return_value = response
+        for name, expected in attrs.items():
+            assert getattr(exc, name) == expected, name
+
+    def test_probe_status_ok(self, openrouter_settings):
+        response = FakeResponse(
+            200,
+            {
+                "data": {
+                    "limit_requests": 60,
+                    "remaining_requests": 55,
+                    "credits_remaining": 1.2,
+                }
+            },
+        )
+
+        mock_session = FakeSession(get_response=response)
 
         client = OpenRouterClient()
         client._session = mock_session
 
-        with pytest.raises(QuotaExceededError) as exc_info:
-            client.generate("Prompt rate")
+        result = client.probe()
+        assert result["status"] == "OK"
+        assert isinstance(result.get("meta"), dict)
+        assert result["meta"]["remaining_requests"] == 55
 
-        exc = exc_info.value
-        assert exc.provider == "openrouter"
-        assert exc.error_type == "rate_limited"
-        assert exc.retry_after == pytest.approx(9.0, rel=1e-3)
-
-    @patch("app.core.services.ai.openrouter_client.settings")
-    def test_generate_5xx_is_transient(self, mock_settings):
-        mock_settings.OPENROUTER_API_KEY = "or-key"
-        mock_settings.OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
-        mock_settings.OPENROUTER_MODEL = "openai/gpt-oss-120b:free"
-        mock_settings.OPENROUTER_TIMEOUT_SECONDS = 30
-        mock_settings.OPENROUTER_HTTP_REFERER = ""
-        mock_settings.OPENROUTER_APP_TITLE = ""
-
-        response = MagicMock()
-        response.status_code = 503
-        response.json.return_value = {"error": {"message": "Service unavailable"}}
-
-        mock_session = MagicMock()
-        mock_session.post.return_value = response
+    def test_probe_decodes_body_once(self, openrouter_settings, monkeypatch):
+        response = FakeResponse(429, {"error": {"message": "Rate limit exceeded, retry after 4s"}})
+        decoded = []
+        original = OpenRouterClient._safe_json
 
-        client = OpenRouterClient()
-        client._session = mock_session
+        def counting_safe_json(resp):
+            decoded.append(resp)
+            return original(resp)
 
-        with pytest.raises(ProviderTransientError):
-            client.generate("Prompt 5xx")
-
-    @patch("app.core.services.ai.openrouter_client.settings")
-    def test_probe_status_ok(self, mock_settings):
-        mock_settings.OPENROUTER_API_KEY = "or-key"
-        mock_settings.OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
-        mock_settings.OPENROUTER_MODEL = "openai/gpt-oss-120b:free"
-        mock_settings.OPENROUTER_TIMEOUT_SECONDS = 30
-        mock_settings.OPENROUTER_HTTP_REFERER = ""
-        mock_settings.OPENROUTER_APP_TITLE = ""
-
-        response = MagicMock()
-        response.status_code = 200
-        response.json.return_value = {
-            "data": {
-                "limit_requests": 60,
-                "remaining_requests": 55,
-                "credits_remaining": 1.2,
-            }
-        }
-
-        mock_session = MagicMock()
-        mock_session.get.return_value = response
+        monkeypatch.setattr(OpenRouterClient, "_safe_json", staticmethod(counting_safe_json))
 
         client = OpenRouterClient()
-        client._session = mock_session
+        client._session = FakeSession(get_response=response)
 
         result = client.probe()
-        assert result["status"] == "OK"
-        assert isinstance(result.get("meta"), dict)
-        assert result["meta"]["remaining_requests"] == 55
+        assert result["status"] == "RATE_LIMITED"
+        assert result["retry_after_s"] == 4
+        assert len(decoded) == 1
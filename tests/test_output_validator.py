@@ -3,15 +3,11 @@
 import pytest
 
 from app.core.services.ai.output_validator import OutputValidator, ValidationError
-
-
-@pytest.fixture
-def validator():
-    return OutputValidator()
+from app.core.services.toc_detector import TOC_TITLES
 
 
 class TestValidate:
-    def test_valid_ai_result(self, validator):
+    def test_valid_ai_result(self, output_validator):
         ai_result = {
             "sections": [
                 {
@@ -26,37 +22,37 @@ class TestValidate:
                 },
             ]
         }
-        result = validator.validate(ai_result)
+        result = output_validator.validate(ai_result)
         assert len(result["sections"]) == 2
         assert result["sections"][0]["sectionId"] == "sec-0001"
 
-    def test_missing_sections_raises(self, validator):
+    def test_missing_sections_raises(self, output_validator):
         with pytest.raises(ValidationError, match="non-empty list"):
-            validator.validate({"sections": []})
+            output_validator.validate({"sections": []})
 
-    def test_not_a_dict_raises(self, validator):
+    def test_not_a_dict_raises(self, output_validator):
         with pytest.raises(ValidationError, match="must be a dict"):
-            validator.validate("not a dict")
+            output_validator.validate("not a dict")
 
-    def test_missing_section_id_auto_assigned(self, validator):
+    def test_missing_section_id_auto_assigned(self, output_validator):
         ai_result = {
             "sections": [
                 {"path": "Intro", "content": "Texto suficientemente largo para pasar."},
             ]
         }
-        result = validator.validate(ai_result)
+        result = output_validator.validate(ai_result)
         assert result["sections"][0]["sectionId"].startswith("sec-auto-")
 
-    def test_empty_content_warning(self, validator):
+    def test_empty_content_warning(self, output_validator):
         ai_result = {
             "sections": [
                 {"sectionId": "sec-0001", "path": "Intro", "content": ""},
             ]
         }
-        result = validator.validate(ai_result)
+        result = output_validator.validate(ai_result)
         assert result["sections"][0]["content"] == ""
 
-    def test_sanitizes_markdown_and_placeholders(self, validator):
+    def test_sanitizes_markdown_and_placeholders(self, output_validator):
         ai_result = {
             "sections": [
                 {
@@ -73,7 +69,7 @@ class TestValidate:
             ]
         }
 
-        result = validator.validate(ai_result)
+        result = output_validator.validate(ai_result)
         content = result["sections"][0]["content"]
         assert "###" not in content
         assert "**" not in content
@@ -82,7 +78,7 @@ class TestValidate:
         assert "TITULO DEL PROYECTO" not in content
         assert "item con vineta" in content
 
-    def test_index_path_forces_empty_content(self, validator):
+    def test_index_path_forces_empty_content(self, output_validator):
         """TOC sections are now DROPPED entirely, not just emptied."""
         ai_result = {
             "sections": [
@@ -99,12 +95,12 @@ class TestValidate:
             ]
         }
 
-        result = validator.validate(ai_result)
+        result = output_validator.validate(ai_result)
         # sec-0001 was dropped
         assert len(result["sections"]) == 1
         assert result["sections"][0]["sectionId"] == "sec-0002"
 
-    def test_skip_section_token_is_normalized_to_empty(self, validator):
+    def test_skip_section_token_is_normalized_to_empty(self, output_validator):
         ai_result = {
             "sections": [
                 {
@@ -114,10 +110,10 @@ class TestValidate:
                 }
             ]
         }
-        result = validator.validate(ai_result)
+        result = output_validator.validate(ai_result)
         assert result["sections"][0]["content"] == ""
 
-    def test_abbreviations_are_normalized_to_tab_format(self, validator):
+    def test_abbreviations_are_normalized_to_tab_format(self, output_validator):
         ai_result = {
             "sections": [
                 {
@@ -132,13 +128,13 @@ class TestValidate:
             ]
         }
 
-        result = validator.validate(ai_result)
+        result = output_validator.validate(ai_result)
         content = result["sections"][0]["content"]
         assert "IA\tInteligencia Artificial" in content
         assert "ERP\tPlanificacion de recursos empresariales" in content
         assert "OMS\tOrganizacion Mundial de la Salud" in content
 
-    def test_index_of_abbreviations_forces_empty_content(self, validator):
+    def test_index_of_abbreviations_forces_empty_content(self, output_validator):
         """ÍNDICE DE ABREVIATURAS is a TOC heading — dropped entirely."""
         ai_result = {
             "sections": [
@@ -155,16 +151,40 @@ class TestValidate:
             ]
         }
 
-        result = validator.validate(ai_result)
+        result = output_validator.validate(ai_result)
         assert len(result["sections"]) == 1
         assert result["sections"][0]["sectionId"] == "sec-0002"
 
+    def test_index_titles_are_covered_by_toc_detector(self):
+        """validate() skips the index-path check for sections that passed is_toc_path."""
+        assert OutputValidator._INDEX_TITLES <= TOC_TITLES
+
+
+class TestValidateMany:
+    def test_returns_surviving_sections(self, output_validator):
+        sections = [
+            {"sectionId": "s1", "path": "Cap 1", "content": "**Contenido** del capitulo uno."},
+            {"sectionId": "s2", "path": "ÍNDICE", "content": "Introduccion .... 1"},
+            "not a dict",
+            {"sectionId": "s1", "path": "Cap 2", "content": "Contenido del capitulo dos."},
+        ]
+        result = output_validator.validate_many(sections)
+        assert [s["sectionId"] for s in result] == ["s1", "s1-dup-3"]
+        assert result[0]["content"] == "Contenido del capitulo uno."
+
+    def test_nothing_left_returns_empty_list(self, output_validator):
+        assert output_validator.validate_many([{"sectionId": "s1", "path": "ÍNDICE", "content": "x"}]) == []
+
+    def test_validate_raises_when_nothing_left(self, output_validator):
+        with pytest.raises(ValidationError, match="No valid sections"):
+            output_validator.validate({"sections": [{"sectionId": "s1", "path": "ÍNDICE", "content": "x"}]})
+
 
 class TestBuildAiResult:
-    def test_build_and_validate(self, validator):
+    def test_build_and_validate(self, output_validator):
         sections = [
             {"sectionId": "s1", "path": "Cap 1", "content": "Contenido capitulo uno largo."},
         ]
-        result = validator.build_ai_result(sections)
+        result = output_validator.build_ai_result(sections)
         assert "sections" in result
         assert result["sections"][0]["sectionId"] == "s1"
@@ -0,0 +1,24 @@
+"""Unit tests for phase policy construction."""
+
+from app.core.services.ai.phase_policy import PhasePolicy, build_phase_policies
+
+
+def test_phase_policy_stores_chain_as_tuple_and_is_hashable():
+    policy = PhasePolicy(
+        critical=True,
+        fallback_chain=["mistral", "gemini"],
+        max_input_tokens=6000,
+        max_output_tokens=1200,
+        allow_degraded=False,
+    )
+
+    assert policy.fallback_chain == ("mistral", "gemini")
+    assert {policy: "generate"}[policy] == "generate"
+    assert not hasattr(policy, "__dict__")
+
+
+def test_built_policies_are_hashable():
+    policies = build_phase_policies()
+
+    assert len(set(policies.values())) == len(policies)
+    assert all(type(policy.fallback_chain) is tuple for policy in policies.values())
@@ -7,7 +7,11 @@ Uses a minimal format definition and a fake AI provider to verify that:
 4. The final adapted payload contains only real chapter content.
 """
 
-from app.core.services.ai.output_validator import OutputValidator
+import copy
+from operator import itemgetter
+
+import pytest
+
 from app.core.services.definition_compiler import compile_definition_to_section_index
 from app.modules.api.router import _adapt_ai_result_for_gicatesis
 
@@ -69,16 +73,30 @@ MINIMAL_FORMAT = {
 }
 
 
-def test_compiler_never_emits_toc():
+# Compiled once at import so the individual paths can parametrize tests.
+SECTION_INDEX = compile_definition_to_section_index(MINIMAL_FORMAT)
+
+_get_path = itemgetter("path")
+
+# Stand-in for provider output; long enough to pass the validator's checks.
+GENERATED_CONTENT = "Generated academic content for '{path}' with sufficient length to pass validation checks."
+
+
+@pytest.fixture(scope="module")
+def section_index():
+    """MINIMAL_FORMAT's section index; tests only read it."""
+    return SECTION_INDEX
+
+
+@pytest.mark.parametrize("path", list(map(_get_path, SECTION_INDEX)))
+def test_compiler_never_emits_toc(path):
     """compile_definition_to_section_index produces ZERO TOC paths."""
-    section_index = compile_definition_to_section_index(MINIMAL_FORMAT)
-    paths = [s["path"] for s in section_index]
+    assert "ÍNDICE" not in path, f"TOC leaked: {path}"
+    assert "INDICE" not in path.upper(), f"TOC leaked: {path}"
 
-    for path in paths:
-        assert "ÍNDICE" not in path, f"TOC leaked: {path}"
-        assert "INDICE" not in path.upper(), f"TOC leaked: {path}"
 
-    # Real sections ARE present
+def test_compiler_keeps_real_sections(section_index):
+    paths = list(map(_get_path, section_index))
     assert any("INTRODUCCIÓN" in p for p in paths)
     assert any("I. PLANTEAMIENTO DEL PROBLEMA" in p for p in paths)
     assert any("1.1" in p for p in paths)
@@ -87,10 +105,15 @@ def test_compiler_never_emits_toc():
     assert any("2.1" in p for p in paths)
 
 
-def test_fake_provider_never_called_for_toc():
-    """Simulate the AI loop and verify no TOC section is dispatched."""
-    section_index = compile_definition_to_section_index(MINIMAL_FORMAT)
+def test_compiler_leaves_shared_definition_untouched():
+    """MINIMAL_FORMAT is shared by every test here; compiling must not mutate it."""
+    snapshot = copy.deepcopy(MINIMAL_FORMAT)
+    compile_definition_to_section_index(MINIMAL_FORMAT)
+    assert MINIMAL_FORMAT == snapshot
 
+
+def test_fake_provider_never_called_for_toc(section_index):
+    """Simulate the AI loop and verify no TOC section is dispatched."""
     called_paths = []
 
     def fake_provider(path: str, section_id: str) -> str:
@@ -114,10 +137,8 @@ def test_fake_provider_never_called_for_toc():
         assert "INDICE" not in path.upper(), f"Provider was called for TOC: {path}"
 
 
-def test_validator_drops_injected_toc_sections():
+def test_validator_drops_injected_toc_sections(output_validator):
     """If TOC sections somehow leak into aiResult, the validator drops them."""
-    validator = OutputValidator()
-
     raw_sections = [
         # ToC sections (should be dropped)
         {"sectionId": "sec-0001", "path": "ÍNDICE", "content": "Fake TOC"},
@@ -131,7 +152,7 @@ def test_validator_drops_injected_toc_sections():
         {"sectionId": "sec-0008", "path": "I. PLANTEAMIENTO/1.1 Problema", "content": "Real chapter"},
     ]
 
-    result = validator.build_ai_result(raw_sections)
+    result = output_validator.build_ai_result(raw_sections)
     section_ids = [s["sectionId"] for s in result["sections"]]
 
     # All TOC sections dropped
@@ -161,7 +182,7 @@ def test_adapter_filters_toc_from_old_project_data():
     }
 
     adapted = _adapt_ai_result_for_gicatesis(ai_result)
-    adapted_paths = [s["path"] for s in adapted["sections"]]
+    adapted_paths = list(map(_get_path, adapted["sections"]))
 
     # All ÍNDICE/* paths removed
     assert all("ÍNDICE" not in p and "INDICE" not in p.upper() for p in adapted_paths)
@@ -170,25 +191,22 @@ def test_adapter_filters_toc_from_old_project_data():
     assert "I. PLANTEAMIENTO/1.1 Problema" in adapted_paths
 
 
-def test_end_to_end_pipeline():
+def test_end_to_end_pipeline(output_validator, section_index):
     """Full pipeline: compile → generate → validate → adapt."""
-    # Step 1: Compile
-    section_index = compile_definition_to_section_index(MINIMAL_FORMAT)
+    # Step 1: Compile (shared module fixture)
 
     # Step 2: Simulate generation
     ai_sections = [
         {
             "sectionId": sec["sectionId"],
             "path": sec["path"],
-            "content": f"Generated academic content for '{sec['path']}' "
-            f"with sufficient length to pass validation checks.",
+            "content": GENERATED_CONTENT.format(path=sec["path"]),
         }
         for sec in section_index
     ]
 
     # Step 3: Validate
-    validator = OutputValidator()
-    validated = validator.build_ai_result(ai_sections)
+    validated = output_validator.build_ai_result(ai_sections)
 
     # Step 4: Adapt for GicaTesis
     adapted = _adapt_ai_result_for_gicatesis(validated)
@@ -198,7 +216,7 @@ def test_end_to_end_pipeline():
         assert "INDICE" not in sec["path"].upper(), f"TOC in final payload: {sec['path']}"
 
     # Verify: real sections present
-    paths = [s["path"] for s in adapted["sections"]]
+    paths = list(map(_get_path, adapted["sections"]))
     assert any("INTRODUCCIÓN" in p for p in paths)
     assert any("I. PLANTEAMIENTO" in p for p in paths)
     assert any("1.1" in p for p in paths)
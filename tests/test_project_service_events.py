@@ -1,22 +1,15 @@
 """Unit tests for ProjectService event storage helpers."""
 
-from app.core.services.project_service import ProjectService
+import pytest
 
 
-def test_append_event_truncates_to_200(tmp_path):
-    service = ProjectService(str(tmp_path / "projects.json"))
+def test_append_event_truncates_to_200(service_factory):
+    service = service_factory()
     project = service.create_project({"title": "Event window test"})
     project_id = project["id"]
 
     for index in range(250):
-        service.append_event(
-            project_id,
-            {
-                "ts": f"2026-02-19T10:00:{index:02d}Z",
-                "stage": "test.event",
-                "message": f"event-{index}",
-            },
-        )
+        service.append_event(project_id, {"stage": "test.event", "message": f"event-{index}"})
 
     updated = service.get_project(project_id)
     assert updated is not None
@@ -28,8 +21,113 @@ def test_append_event_truncates_to_200(tmp_path):
     assert updated["trace"] == events
 
 
-def test_mark_completed_with_warning_incidents_sets_incident_status(tmp_path):
-    service = ProjectService(str(tmp_path / "projects.json"))
+def test_append_events_bulk_keeps_last_200(service_factory):
+    service = service_factory()
+    project_id = service.create_project({"title": "Bulk events"})["id"]
+    service.append_event(project_id, {"message": "before"})
+
+    events = [{"ts": f"2026-02-19T10:{i // 60:02d}:{i % 60:02d}Z", "message": f"event-{i}"} for i in range(250)]
+    updated = service.append_events_bulk(project_id, events)
+
+    assert updated is not None
+    assert len(updated["events"]) == 200
+    assert updated["events"][0]["message"] == "event-50"
+    assert updated["events"][-1]["message"] == "event-249"
+    assert service.append_events_bulk("proj_missing", events) is None
+
+
+def test_batch_coalesces_writes_into_one(service_factory, monkeypatch):
+    service = service_factory()
+    project_id = service.create_project({"title": "Batch writes"})["id"]
+
+    writes = []
+    original_write = service.store.write_list
+    monkeypatch.setattr(service.store, "write_list", lambda items: writes.append(1) or original_write(items))
+
+    with service.batch():
+        service.update_progress(project_id, current=1, total=3)
+        with service.batch():
+            service.update_progress(project_id, current=2)
+        # Reads inside the batch see pending mutations.
+        assert service.get_project(project_id)["progress"]["current"] == 2
+        assert writes == []
+
+    assert writes == [1]
+    reloaded = service_factory().get_project(project_id)
+    assert reloaded["progress"]["current"] == 2
+
+
+def test_append_event_goes_to_log_and_is_folded_on_next_write(tmp_path, service_factory, monkeypatch):
+    service = service_factory()
+    project_id = service.create_project({"title": "Event log"})["id"]
+
+    writes = []
+    original_write = service.store.write_list
+    monkeypatch.setattr(service.store, "write_list", lambda items: writes.append(1) or original_write(items))
+
+    service.append_event(project_id, {"message": "first"})
+    service.append_event(project_id, {"message": "second"})
+    assert writes == []
+    log_path = tmp_path / "projects" / f"{project_id}.events.jsonl"
+    assert log_path.exists()
+    assert [e["message"] for e in service.list_trace(project_id)] == ["first", "second"]
+
+    service.update_progress(project_id, current=1)
+    assert writes == [1]
+    assert not log_path.exists()
+    service.append_event(project_id, {"message": "third"})
+
+    reloaded = service_factory().get_project(project_id)
+    assert [e["message"] for e in reloaded["events"]] == ["first", "second", "third"]
+    assert reloaded["trace"] == reloaded["events"]
+
+
+def test_append_event_reads_the_event_log_once(service_factory, monkeypatch):
+    from app.core.storage.json_store import JsonLinesStore
+
+    service = service_factory()
+    project_id = service.create_project({"title": "Cached tail"})["id"]
+    service.append_event(project_id, {"message": "event-0"})
+
+    reads = []
+    original_tail_lines = JsonLinesStore.tail_lines
+    monkeypatch.setattr(
+        JsonLinesStore, "tail_lines", lambda self, limit: reads.append(1) or original_tail_lines(self, limit)
+    )
+
+    for index in range(1, 250):
+        updated = service.append_event(project_id, {"message": f"event-{index}"})
+
+    assert reads == []
+    assert [e["message"] for e in updated["events"]] == [f"event-{i}" for i in range(50, 250)]
+
+    service.update_progress(project_id, current=1)
+    service.append_event(project_id, {"message": "after-fold"})
+    assert len(reads) == 1
+    assert service.get_project(project_id)["events"][-1]["message"] == "after-fold"
+    assert len(service.get_project(project_id)["events"]) == 200
+
+
+def test_append_event_unknown_project_returns_none(tmp_path, service_factory):
+    service = service_factory()
+
+    assert service.append_event("proj_missing", {"message": "x"}) is None
+    assert not (tmp_path / "projects").exists()
+
+
+def test_append_event_stores_a_snapshot_of_the_event(service_factory):
+    service = service_factory()
+    project_id = service.create_project({"title": "Snapshot"})["id"]
+    event = {"stage": "generation", "meta": {"attempt": 1}}
+
+    service.append_event(project_id, event)
+    event["meta"]["attempt"] = 2
+
+    assert service.get_project(project_id)["events"][-1]["meta"] == {"attempt": 1}
+
+
+def test_mark_completed_with_warning_incidents_sets_incident_status(service_factory):
+    service = service_factory()
     project = service.create_project({"title": "Incidents status"})
     project_id = project["id"]
 
@@ -50,8 +148,8 @@ def test_mark_completed_with_warning_incidents_sets_incident_status(tmp_path):
     assert len(updated["incidents"]) == 1
 
 
-def test_mark_failed_can_keep_partial_ai_result(tmp_path):
-    service = ProjectService(str(tmp_path / "projects.json"))
+def test_mark_failed_can_keep_partial_ai_result(service_factory):
+    service = service_factory()
     project = service.create_project({"title": "Partial resume"})
     project_id = project["id"]
 
@@ -79,8 +177,8 @@ def test_mark_failed_can_keep_partial_ai_result(tmp_path):
     assert failed["run_id"] == "run-001"
 
 
-def test_resume_checkpoint_is_saved_and_cleared_on_complete(tmp_path):
-    service = ProjectService(str(tmp_path / "projects.json"))
+def test_resume_checkpoint_is_saved_and_cleared_on_complete(service_factory):
+    service = service_factory()
     project = service.create_project({"title": "Resume checkpoint"})
     project_id = project["id"]
 
@@ -102,3 +200,42 @@ def test_resume_checkpoint_is_saved_and_cleared_on_complete(tmp_path):
     assert completed is not None
     assert completed["resume"]["eligible"] is False
     assert completed["resume"]["saved_sections_count"] == 0
+
+
+def test_failed_batch_flush_keeps_the_event_log(tmp_path, service_factory, monkeypatch):
+    service = service_factory()
+    project_id = service.create_project({"title": "Batch failure"})["id"]
+    service.append_event(project_id, {"message": "e1"})
+    log_path = tmp_path / "projects" / f"{project_id}.events.jsonl"
+
+    def _failing_write(items):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(service.store, "write_list", _failing_write)
+    with pytest.raises(OSError), service.batch():
+        service.update_progress(project_id, current=1)
+        # Folded into the pending items, but the log is kept until the flush.
+        assert log_path.exists()
+        service.append_event(project_id, {"message": "e2"})
+        assert [e["message"] for e in service.get_project(project_id)["events"]] == ["e1", "e2"]
+
+    assert log_path.exists()
+    reloaded = service_factory().get_project(project_id)
+    assert [e["message"] for e in reloaded["events"]] == ["e1", "e2"]
+
+
+def test_batch_flush_folds_and_drops_the_event_log(tmp_path, service_factory):
+    service = service_factory()
+    project_id = service.create_project({"title": "Batch fold"})["id"]
+    service.append_event(project_id, {"message": "e1"})
+    log_path = tmp_path / "projects" / f"{project_id}.events.jsonl"
+
+    with service.batch():
+        service.update_progress(project_id, current=1)
+        service.append_event(project_id, {"message": "e2"})
+        service.update_progress(project_id, current=2)
+
+    assert not log_path.exists()
+    reloaded = service_factory().get_project(project_id)
+    assert [e["message"] for e in reloaded["events"]] == ["e1", "e2"]
+    assert reloaded["progress"]["current"] == 2
@@ -1,41 +1,54 @@
 """Tests for app.core.services.ai.prompt_renderer."""
-import pytest
-from app.core.services.ai.prompt_renderer import PromptRenderer, SYSTEM_PROMPT
 
+from app.core.services.ai.prompt_renderer import SYSTEM_PROMPT
 
-@pytest.fixture
-def renderer():
-    return PromptRenderer()
+
+def _missing_from(text, needles):
+    """Needles absent from *text*, so one assert reports every miss."""
+    return [needle for needle in needles if needle not in text]
 
 
 class TestRender:
-    def test_basic_substitution(self, renderer):
+    def test_basic_substitution(self, prompt_renderer):
         template = "Tema: {{tema}}. Objetivo: {{objetivo_general}}."
         values = {"tema": "IA en salud", "objetivo_general": "mejorar diagnosticos"}
-        result = renderer.render(template, values)
+        result = prompt_renderer.render(template, values)
         assert result == "Tema: IA en salud. Objetivo: mejorar diagnosticos."
 
-    def test_missing_variables_kept_as_placeholders(self, renderer):
+    def test_missing_variables_kept_as_placeholders(self, prompt_renderer):
         template = "Tema: {{tema}}. Hipotesis: {{hipotesis}}."
         values = {"tema": "Redes neuronales"}
-        result = renderer.render(template, values)
+        result = prompt_renderer.render(template, values)
         assert "Redes neuronales" in result
         assert "{{hipotesis}}" in result  # kept as-is
 
-    def test_empty_template(self, renderer):
-        result = renderer.render("", {"tema": "algo"})
+    def test_empty_template(self, prompt_renderer):
+        result = prompt_renderer.render("", {"tema": "algo"})
         assert result == ""
 
-    def test_whitespace_in_braces(self, renderer):
+    def test_template_without_placeholders_is_unchanged(self, prompt_renderer):
+        template = "Redacta un texto formal sobre {tema} sin variables."
+        assert prompt_renderer.render(template, {"tema": "X"}) == template
+
+    def test_whitespace_in_braces(self, prompt_renderer):
         template = "{{ tema }} y {{  objetivo_general  }}"
         values = {"tema": "X", "objetivo_general": "Y"}
-        result = renderer.render(template, values)
+        result = prompt_renderer.render(template, values)
         assert result == "X y Y"
 
+    def test_render_trace_hook_called(self, prompt_renderer):
+        events = []
+        result = prompt_renderer.render("Tema: {{tema}} {{faltante}}", {"tema": "X"}, trace_hook=events.append)
+        assert result == "Tema: X {{faltante}}"
+        assert len(events) == 1
+        assert events[0]["step"] == "prompt.render"
+        assert events[0]["meta"] == {"missingVariables": ["faltante"]}
+        assert events[0]["preview"] == {"prompt": result}
+
 
 class TestBuildSectionPrompt:
-    def test_section_prompt_contains_path(self, renderer):
-        prompt = renderer.build_section_prompt(
+    def test_section_prompt_contains_path(self, prompt_renderer):
+        prompt = prompt_renderer.build_section_prompt(
             base_prompt="Escribe sobre IA",
             section_path="Capitulo 1 > Introduccion",
             section_id="sec-0001",
@@ -44,8 +57,8 @@ class TestBuildSectionPrompt:
         assert "sec-0001" in prompt
         assert "Escribe sobre IA" in prompt
 
-    def test_section_prompt_with_extra_context(self, renderer):
-        prompt = renderer.build_section_prompt(
+    def test_section_prompt_with_extra_context(self, prompt_renderer):
+        prompt = prompt_renderer.build_section_prompt(
             base_prompt="Base",
             section_path="Marco Teorico",
             section_id="sec-0002",
@@ -53,18 +66,16 @@ class TestBuildSectionPrompt:
         )
         assert "Incluir 3 referencias APA" in prompt
 
-    def test_system_prompt_included(self, renderer):
+    def test_system_prompt_included(self, prompt_renderer):
         """System prompt formatting rules must appear in every section prompt."""
-        prompt = renderer.build_section_prompt(
+        prompt = prompt_renderer.build_section_prompt(
             base_prompt="Base",
             section_path="Introduccion",
             section_id="sec-0001",
         )
-        assert "REGLAS OBLIGATORIAS" in prompt
-        assert "NO uses Markdown" in prompt
-        assert "Texto plano" in prompt.lower() or "texto plano" in prompt
+        assert _missing_from(prompt, ("REGLAS OBLIGATORIAS", "NO uses Markdown", "texto plano")) == []
 
-    def test_system_prompt_renders_project_values(self, renderer):
+    def test_system_prompt_renders_project_values(self, prompt_renderer):
         """Project variables in SYSTEM_PROMPT should be rendered."""
         values = {
             "title": "Mi Tesis",
@@ -73,23 +84,37 @@ class TestBuildSectionPrompt:
             "poblacion": "Empresas",
             "variable_independiente": "Algoritmos",
         }
-        prompt = renderer.build_section_prompt(
+        prompt = prompt_renderer.build_section_prompt(
             base_prompt="Base",
             section_path="Intro",
             section_id="sec-0001",
             values=values,
         )
-        assert "Mi Tesis" in prompt
-        assert "IA Logistica" in prompt
-        assert "Optimizar" in prompt
-        assert "Empresas" in prompt
-        assert "Algoritmos" in prompt
+        assert _missing_from(prompt, values.values()) == []
+
+    def test_missing_system_variables_warn_on_every_call(self, prompt_renderer, caplog):
+        """The rendered system prompt is cached; the missing-variable warning is not."""
+        for _ in range(2):
+            with caplog.at_level("WARNING", logger="app.core.services.ai.prompt_renderer"):
+                caplog.clear()
+                prompt = prompt_renderer.build_section_prompt(
+                    base_prompt="Base",
+                    section_path="Intro",
+                    section_id="sec-0001",
+                    values={"tema": "IA"},
+                )
+            assert "{{title}}" in prompt
+            assert "IA" in prompt
+            assert "title" in caplog.text
 
     def test_system_prompt_constant_has_rules(self):
         """Verify the SYSTEM_PROMPT constant contains key formatting rules."""
-        assert "NO uses Markdown" in SYSTEM_PROMPT
-        assert "NO escribas el titulo" in SYSTEM_PROMPT
-        assert "FIGURA DE EJEMPLO" in SYSTEM_PROMPT
-        assert "<<SKIP_SECTION>>" in SYSTEM_PROMPT
-        assert "{{title}}" in SYSTEM_PROMPT
-        assert "{{tema}}" in SYSTEM_PROMPT
+        rules = (
+            "NO uses Markdown",
+            "NO escribas el titulo",
+            "FIGURA DE EJEMPLO",
+            "<<SKIP_SECTION>>",
+            "{{title}}",
+            "{{tema}}",
+        )
+        assert _missing_from(SYSTEM_PROMPT, rules) == []
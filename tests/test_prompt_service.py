@@ -0,0 +1,109 @@
+"""Tests for app.core.services.prompt_service."""
+
+import json
+import re
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from app.core.services.prompt_service import PromptService
+
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+_REQUIRED_FIELDS = frozenset({"id", "name", "doc_type", "is_active", "template", "variables"})
+
+# Read at collection time so each shipped prompt gets its own test ids.
+PROMPTS_JSON = Path(__file__).resolve().parent.parent / "data" / "prompts.json"
+SHIPPED_PROMPT_IDS = [p["id"] for p in json.loads(PROMPTS_JSON.read_text(encoding="utf-8"))]
+
+
+@pytest.fixture(scope="module")
+def prompt_audit(real_prompts):
+    """Duplicate ids and missing fields across the shipped prompts, in one pass."""
+    counts: Counter = Counter()
+    missing_fields = {}
+    for prompt in real_prompts:
+        pid = prompt.get("id", "?")
+        counts[pid] += 1
+        missing = _REQUIRED_FIELDS - prompt.keys()
+        if missing:
+            missing_fields[pid] = sorted(missing)
+    return {
+        "duplicate_ids": [pid for pid, n in counts.items() if n > 1],
+        "missing_fields": missing_fields,
+    }
+
+
+@pytest.fixture(scope="module")
+def shipped_prompt(request, real_prompt_service, prompt_renderer):
+    """``(prompt, rendered template)`` for the indirect prompt id, built once per id."""
+    prompt = real_prompt_service.get_prompt(request.param)
+    values = {name: f"<{name}>" for name in prompt["variables"]}
+    return prompt, prompt_renderer.render(prompt["template"], values)
+
+
+class TestShippedPrompts:
+    def test_prompts_file_is_not_empty(self, real_prompts):
+        assert real_prompts
+
+    def test_prompt_ids_are_unique(self, prompt_audit):
+        assert prompt_audit["duplicate_ids"] == []
+
+    def test_every_prompt_has_required_fields(self, prompt_audit):
+        assert prompt_audit["missing_fields"] == {}
+
+    def test_get_prompt_unknown_id_returns_none(self, real_prompt_service):
+        assert real_prompt_service.get_prompt("prompt_missing") is None
+
+
+@pytest.mark.parametrize("shipped_prompt", SHIPPED_PROMPT_IDS, indirect=True)
+class TestEachShippedPrompt:
+    def test_get_prompt_finds_it(self, shipped_prompt, real_prompts):
+        prompt, _ = shipped_prompt
+        assert prompt in real_prompts
+
+    def test_declared_variables_match_template(self, shipped_prompt):
+        prompt, _ = shipped_prompt
+        assert set(_PLACEHOLDER_RE.findall(prompt["template"])) == set(prompt["variables"])
+
+    def test_template_renders_every_variable(self, shipped_prompt):
+        prompt, rendered = shipped_prompt
+        assert "{{" not in rendered
+        assert [name for name in prompt["variables"] if f"<{name}>" not in rendered] == []
+
+
+class TestPromptCrud:
+    @pytest.fixture
+    def service(self, tmp_path):
+        return PromptService(path=str(tmp_path / "prompts.json"))
+
+    def test_create_then_get(self, service):
+        created = service.create_prompt({"name": "Nuevo", "template": "Hola {{tema}}", "variables": ["tema"]})
+        assert service.get_prompt(created["id"]) == created
+
+    def test_get_prompt_sees_update(self, service):
+        created = service.create_prompt({"name": "Antes"})
+        assert service.get_prompt(created["id"])["name"] == "Antes"
+        service.update_prompt(created["id"], {"name": "Despues"})
+        assert service.get_prompt(created["id"])["name"] == "Despues"
+
+    def test_get_prompt_sees_writes_from_another_service(self, service, tmp_path):
+        created = service.create_prompt({"name": "Compartido"})
+        assert service.get_prompt(created["id"]) is not None
+        PromptService(path=str(tmp_path / "prompts.json")).delete_prompt(created["id"])
+        assert service.get_prompt(created["id"]) is None
+
+    def test_list_prompts_returns_a_fresh_list(self, service):
+        service.create_prompt({"name": "Uno"})
+        listed = service.list_prompts()
+        listed.clear()
+        assert len(service.list_prompts()) == 1
+
+    def test_update_unknown_prompt_returns_none(self, service):
+        assert service.update_prompt("prompt_missing", {"name": "x"}) is None
+
+    def test_delete(self, service):
+        created = service.create_prompt({"name": "Borrar"})
+        assert service.delete_prompt(created["id"]) is True
+        assert service.delete_prompt(created["id"]) is False
+        assert service.list_prompts() == []
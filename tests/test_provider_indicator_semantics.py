@@ -1,23 +1,42 @@
 """Semantics tests for provider status indicators consumed by the UI."""
 
-from types import SimpleNamespace
-from unittest.mock import patch
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
 
+import pytest
+
+from app.core.services.ai import provider_metrics
 from app.core.services.ai.provider_metrics import ProviderMetricsService
 
 
-def _settings(*, rate_limit_per_minute: int = 60, quota_limit_tokens_month: int = 0) -> SimpleNamespace:
-    return SimpleNamespace(
-        AI_LOCAL_RATE_LIMIT_PER_MINUTE=rate_limit_per_minute,
-        AI_LOCAL_QUOTA_LIMIT_TOKENS_MONTH=quota_limit_tokens_month,
-    )
+@dataclass(frozen=True)
+class _MetricsSettings:
+    AI_LOCAL_RATE_LIMIT_PER_MINUTE: int
+    AI_LOCAL_QUOTA_LIMIT_TOKENS_MONTH: int
+
+
+@lru_cache(maxsize=32)
+def _settings(rate_limit_per_minute: int, quota_limit_tokens_month: int) -> _MetricsSettings:
+    # Frozen, so one instance per combination can be shared across tests.
+    return _MetricsSettings(rate_limit_per_minute, quota_limit_tokens_month)
+
+
+@pytest.fixture
+def use_settings(monkeypatch) -> Callable[..., None]:
+    """Swap the metrics module's settings for the rest of the test."""
+
+    def _apply(*, rate_limit_per_minute: int = 60, quota_limit_tokens_month: int = 0) -> None:
+        monkeypatch.setattr(provider_metrics, "settings", _settings(rate_limit_per_minute, quota_limit_tokens_month))
+
+    return _apply
 
 
-def test_capacity_available_means_remaining_equals_limit_and_no_wait() -> None:
+def test_capacity_available_means_remaining_equals_limit_and_no_wait(use_settings) -> None:
     metrics = ProviderMetricsService()
+    use_settings(rate_limit_per_minute=60)
 
-    with patch("app.core.services.ai.provider_metrics.settings", _settings(rate_limit_per_minute=60)):
-        payload = metrics.payload_for_provider("gemini", model="gemini-2.0-flash", configured=True)
+    payload = metrics.payload_for_provider("gemini", model="gemini-2.0-flash", configured=True)
 
     assert payload["health"] == "OK"
     assert payload["rate_limit"]["remaining"] == 60
@@ -26,25 +45,25 @@ def test_capacity_available_means_remaining_equals_limit_and_no_wait() -> None:
     assert payload["last_probe_status"] == "UNVERIFIED"
 
 
-def test_rate_limited_and_exhausted_states_are_exposed_for_ui() -> None:
+def test_rate_limited_and_exhausted_states_are_exposed_for_ui(use_settings) -> None:
     metrics = ProviderMetricsService()
+    use_settings(rate_limit_per_minute=60)
 
-    with patch("app.core.services.ai.provider_metrics.settings", _settings(rate_limit_per_minute=60)):
-        metrics.record_rate_limited("gemini", retry_after_s=57, message="Rate limited. Retry after 57 seconds.")
-        limited_payload = metrics.payload_for_provider("gemini", model="gemini-2.0-flash", configured=True)
-        assert limited_payload["health"] == "RATE_LIMITED"
-        assert limited_payload["rate_limit"]["reset_seconds"] > 0
+    metrics.record_rate_limited("gemini", retry_after_s=57, message="Rate limited. Retry after 57 seconds.")
+    limited_payload = metrics.payload_for_provider("gemini", model="gemini-2.0-flash", configured=True)
+    assert limited_payload["health"] == "RATE_LIMITED"
+    assert limited_payload["rate_limit"]["reset_seconds"] > 0
 
-        metrics.record_exhausted("gemini", message="Quota exceeded. Check Gemini project quota/billing.")
-        exhausted_payload = metrics.payload_for_provider("gemini", model="gemini-2.0-flash", configured=True)
-        assert exhausted_payload["health"] == "EXHAUSTED"
+    metrics.record_exhausted("gemini", message="Quota exceeded. Check Gemini project quota/billing.")
+    exhausted_payload = metrics.payload_for_provider("gemini", model="gemini-2.0-flash", configured=True)
+    assert exhausted_payload["health"] == "EXHAUSTED"
 
 
-def test_quota_unknown_returns_null_values_for_ui_no_disp_fallback() -> None:
+def test_quota_unknown_returns_null_values_for_ui_no_disp_fallback(use_settings) -> None:
     metrics = ProviderMetricsService()
+    use_settings(quota_limit_tokens_month=0)
 
-    with patch("app.core.services.ai.provider_metrics.settings", _settings(quota_limit_tokens_month=0)):
-        payload = metrics.payload_for_provider("mistral", model="mistral-medium-2505", configured=True)
+    payload = metrics.payload_for_provider("mistral", model="mistral-medium-2505", configured=True)
 
     assert payload["quota"]["remaining"] is None
     assert payload["quota"]["limit"] is None
@@ -63,3 +82,54 @@ def test_probe_metadata_is_persisted_for_ui_badges() -> None:
     payload = metrics.payload_for_provider("mistral", model="mistral-medium-2505", configured=True)
     assert payload["probe"]["status"] == "RATE_LIMITED"
     assert payload["last_probe_retry_after_s"] == 9
+
+
+def test_display_name_falls_back_to_capitalized_provider_id() -> None:
+    metrics = ProviderMetricsService()
+
+    known = metrics.payload_for_provider("openrouter", model="x", configured=True)
+    unknown = metrics.payload_for_provider("groq", model="x", configured=False)
+
+    assert known["display_name"] == "OpenRouter"
+    assert unknown["display_name"] == "Groq"
+    assert unknown["health"] == "UNKNOWN"
+
+
+def test_health_snapshot_matches_payload_fields() -> None:
+    metrics = ProviderMetricsService()
+    metrics.record_probe("gemini", status="AUTH_ERROR", detail="bad key")
+    metrics.record_exhausted("gemini", message="Quota exceeded")
+
+    payload = metrics.payload_for_provider("gemini", model="gemini-2.0-flash", configured=True)
+
+    assert metrics.health_snapshot("gemini", configured=True) == (payload["health"], payload["last_probe_status"])
+    assert metrics.health_snapshot("gemini", configured=True) == ("EXHAUSTED", "AUTH_ERROR")
+
+
+def test_batch_payloads_match_single_provider_payloads(use_settings) -> None:
+    metrics = ProviderMetricsService()
+    use_settings(quota_limit_tokens_month=1000)
+    metrics.record_rate_limited("gemini", retry_after_s=30, message="Retry after 30 seconds.")
+    items = [("gemini", "gemini-2.0-flash", True), ("mistral", "mistral-medium-2505", False)]
+
+    batch = metrics.payloads_for_providers(items)
+    singles = [metrics.payload_for_provider(p, model=m, configured=c) for p, m, c in items]
+
+    assert [payload["id"] for payload in batch] == ["gemini", "mistral"]
+    assert [payload["health"] for payload in batch] == ["RATE_LIMITED", "UNKNOWN"]
+    for batched, single in zip(batch, singles):
+        batched["rate_limit"].pop("reset_seconds")
+        single["rate_limit"].pop("reset_seconds")
+        assert batched == single
+
+
+def test_runtime_state_is_created_once_per_provider() -> None:
+    metrics = ProviderMetricsService()
+
+    metrics.record_error("groq", message="boom")
+    state = metrics._state("groq")
+    metrics.record_rate_limited("groq", retry_after_s=5, message="Retry after 5 seconds.")
+
+    assert metrics._state("groq") is state
+    assert metrics._state("gemini") is metrics._state("gemini")
+    assert len(state.errors_15m) == 2
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from app.core.services.ai.circuit_breaker import CircuitBreaker
 from app.core.services.ai.errors import QuotaExceededError
 from app.core.services.ai.limiter import LLMLimiter
@@ -11,21 +13,52 @@ from app.core.services.ai.resilience_router import LLMProviderRouter, LLMRequest
 
 class _SequenceProvider:
     def __init__(self, sequence):
-        self._sequence = list(sequence)
+        self._responses = iter(tuple(sequence))
         self.calls = 0
 
     def is_configured(self) -> bool:
         return True
 
     def generate(self, _prompt: str, *, model: str | None = None) -> str:  # noqa: ARG002
-        current = self._sequence[self.calls]
+        current = next(self._responses)
         self.calls += 1
         if isinstance(current, Exception):
             raise current
         return str(current)
 
 
-def _build_router(provider: object, sleeps: list[float]) -> LLMProviderRouter:
+class _SleepRecorder:
+    """``sleep_fn`` double that records requested waits instead of sleeping."""
+
+    __slots__ = ("waits",)
+
+    def __init__(self) -> None:
+        self.waits: list[float] = []
+
+    def __call__(self, seconds: float) -> None:
+        self.waits.append(float(seconds))
+
+
+@pytest.fixture(scope="module")
+def openrouter_policies() -> dict[str, PhasePolicy]:
+    """Frozen phase policies; safe to share because the router copies the mapping."""
+    return {
+        "generate_section": PhasePolicy(
+            critical=True,
+            fallback_chain=["openrouter"],
+            max_input_tokens=6000,
+            max_output_tokens=1200,
+            allow_degraded=False,
+        )
+    }
+
+
+def _build_router(
+    provider: object,
+    sleep_fn: _SleepRecorder,
+    policies: dict[str, PhasePolicy],
+) -> LLMProviderRouter:
+    # Limiter and breaker keep per-call state, so each test gets fresh ones.
     limiter = LLMLimiter(
         provider_concurrency={"openrouter": 1},
         provider_rpm={"openrouter": 60},
@@ -37,15 +70,6 @@ def _build_router(provider: object, sleeps: list[float]) -> LLMProviderRouter:
         open_seconds=10,
         half_open_max_trials=1,
     )
-    policies = {
-        "generate_section": PhasePolicy(
-            critical=True,
-            fallback_chain=["openrouter"],
-            max_input_tokens=6000,
-            max_output_tokens=1200,
-            allow_degraded=False,
-        )
-    }
     return LLMProviderRouter(
         providers={"openrouter": provider},
         get_model_for_provider=lambda provider_id: f"{provider_id}-model",
@@ -56,11 +80,13 @@ def _build_router(provider: object, sleeps: list[float]) -> LLMProviderRouter:
         retry_cap_seconds=45.0,
         max_rate_limited_retries=2,
         max_transient_retries=0,
-        sleep_fn=lambda seconds: sleeps.append(float(seconds)),
+        sleep_fn=sleep_fn,
     )
 
 
-def test_openrouter_rate_limit_uses_conservative_waits_when_retry_after_missing() -> None:
+def test_openrouter_rate_limit_uses_conservative_waits_when_retry_after_missing(
+    openrouter_policies: dict[str, PhasePolicy],
+) -> None:
     rate_exc = QuotaExceededError(
         "Rate limited by OpenRouter API.",
         provider="openrouter",
@@ -68,8 +94,8 @@ def test_openrouter_rate_limit_uses_conservative_waits_when_retry_after_missing(
         error_type="rate_limited",
     )
     provider = _SequenceProvider([rate_exc, rate_exc, "ok"])
-    waits: list[float] = []
-    router = _build_router(provider, waits)
+    sleeps = _SleepRecorder()
+    router = _build_router(provider, sleeps, openrouter_policies)
 
     result = router.callLLMWithResilience(
         LLMRequest(
@@ -85,4 +111,4 @@ def test_openrouter_rate_limit_uses_conservative_waits_when_retry_after_missing(
     assert result.status == "ok"
     assert result.provider == "openrouter"
     assert provider.calls == 3
-    assert waits == [10.0, 20.0]
+    assert sleeps.waits == [10.0, 20.0]
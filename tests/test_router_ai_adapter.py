@@ -11,6 +11,14 @@ def test_adapter_returns_empty_sections_for_invalid_payload():
     assert _adapt_ai_result_for_gicatesis(None) == {"sections": []}
     assert _adapt_ai_result_for_gicatesis({}) == {"sections": []}
     assert _adapt_ai_result_for_gicatesis({"sections": "x"}) == {"sections": []}
+    assert _adapt_ai_result_for_gicatesis({"sections": []}) == {"sections": []}
+
+
+def test_adapter_returns_a_fresh_result_for_invalid_payload():
+    first = _adapt_ai_result_for_gicatesis(None)
+    first["sections"].append({"path": "Intro", "content": "x"})
+
+    assert _adapt_ai_result_for_gicatesis(None) == {"sections": []}
 
 
 def test_adapter_keeps_only_canonical_paths():
@@ -166,3 +174,27 @@ def test_adapter_moves_top_level_parent_content_into_first_child():
     assert sections[0]["path"] == "I. PLANTEAMIENTO DEL PROBLEMA/1.1 Descripcion"
     assert "Contenido general del capitulo." in sections[0]["content"]
     assert "Contenido especifico 1.1." in sections[0]["content"]
+
+
+def test_adapter_folds_each_parent_into_its_own_first_child():
+    ai_result = {
+        "sections": [
+            {"sectionId": "sec-0201", "path": "II. MARCO/2.1 Antecedentes", "content": "Antecedentes."},
+            {"sectionId": "sec-0101", "path": "I. PROBLEMA/1.1 Descripcion", "content": "Descripcion."},
+            {"sectionId": "sec-0102", "path": "I. PROBLEMA/1.2 Formulacion", "content": "Formulacion."},
+            {"sectionId": "sec-0100", "path": "I. PROBLEMA", "content": "Intro I."},
+            {"sectionId": "sec-0200", "path": "II. MARCO", "content": "Intro II."},
+            {"sectionId": "sec-0300", "path": "III. METODO", "content": "Sin hijos."},
+        ]
+    }
+
+    sections = _adapt_ai_result_for_gicatesis(ai_result)["sections"]
+    assert [item["path"] for item in sections] == [
+        "II. MARCO/2.1 Antecedentes",
+        "I. PROBLEMA/1.1 Descripcion",
+        "I. PROBLEMA/1.2 Formulacion",
+        "III. METODO",
+    ]
+    assert sections[0]["content"] == "Intro II.\n\nAntecedentes."
+    assert sections[1]["content"] == "Intro I.\n\nDescripcion."
+    assert sections[2]["content"] == "Formulacion."
@@ -111,3 +111,7 @@ class TestIsTocPath:
 
     def test_table_of_contents_english(self):
         assert is_toc_path("Table of Contents/Chapter I") is True
+
+    def test_unhashable_input_is_coerced_not_cached(self):
+        assert is_toc_path(["ÍNDICE"]) is False
+        assert is_toc_title(["ÍNDICE"]) is False